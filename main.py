@@ -94,6 +94,7 @@ def main(argv: List[str]) -> int:
         canvas = Canvas(
             output_path,
             pagesize=job_config.layout.pagesize,
+            pageCompression=1,
         )
 
         counts = render_labels(
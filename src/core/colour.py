@@ -1,5 +1,6 @@
 # file: src/core/colour.py
 
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
@@ -18,8 +19,14 @@ def parse_wavelength(val) -> Optional[float]:
         return None
 
 
+@lru_cache(maxsize=64)
 def wavelength_to_rgb(val) -> Tuple[float, float, float]:
-    """@brief Convert wavelength in nm to approximate RGB tuple."""
+    """
+    @brief Convert wavelength in nm to approximate RGB tuple.
+
+    Results are cached per input value, since a sheet typically repeats
+    the same few LED wavelengths.
+    """
     nm = parse_wavelength(val)
     if nm is None:
         return 0.95, 0.95, 1.00
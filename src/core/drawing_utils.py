@@ -1,6 +1,6 @@
 # file: src/drawing/drawing_utils.py
 
-from typing import Protocol
+from typing import Optional, Protocol, Tuple
 
 from reportlab.lib.colors import black
 from reportlab.pdfgen.canvas import Canvas
@@ -23,6 +23,53 @@ class rect_like_t(Protocol):
     height: float
 
 
+class canvas_state_t:
+    """
+    @brief	Per-draw record of the fill/stroke colour and font last set.
+
+    		Setters skip the canvas call when the value is unchanged. Create
+    		one per draw call; restoreState or direct canvas setters made
+    		behind its back leave the record stale.
+    """
+
+    __slots__ = ("_canvas", "_fill", "_stroke", "_font")
+
+    def __init__(self, canvas: Canvas) -> None:
+        self._canvas = canvas
+        self._fill: Optional[Tuple[float, float, float]] = None
+        self._stroke: Optional[Tuple[float, float, float]] = None
+        self._font: Optional[Tuple[str, float]] = None
+
+    def set_fill(self, rgb: Tuple[float, float, float]) -> None:
+        """
+        @brief	Set the fill colour unless it is already current.
+        @param rgb	Fill colour RGB tuple
+        """
+        if rgb != self._fill:
+            self._canvas.setFillColorRGB(rgb[0], rgb[1], rgb[2])
+            self._fill = rgb
+
+    def set_stroke(self, rgb: Tuple[float, float, float]) -> None:
+        """
+        @brief	Set the stroke colour unless it is already current.
+        @param rgb	Stroke colour RGB tuple
+        """
+        if rgb != self._stroke:
+            self._canvas.setStrokeColorRGB(rgb[0], rgb[1], rgb[2])
+            self._stroke = rgb
+
+    def set_font(self, name: str, size: float) -> None:
+        """
+        @brief	Set the font unless it is already current.
+        @param name	Font name
+        @param size	Font size in points
+        """
+        font = (name, size)
+        if font != self._font:
+            self._canvas.setFont(name, size)
+            self._font = font
+
+
 def draw_rounded_outline(
     canvas: Canvas,
     rect: rect_like_t,
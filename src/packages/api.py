@@ -10,7 +10,7 @@ from reportlab.pdfgen.canvas import Canvas
 
 from src.core.geometry import simple_rect
 from src.packages.resolve import resolve_package
-from src.packages import registry as _registry
+from src.packages.registry import get_family_drawer
 
 
 def format_package_for_text(raw: str) -> str:
@@ -51,7 +51,7 @@ def draw_package(
     if resolved.family_id is None:
         return
 
-    drawer = _registry.FAMILY_DRAWERS.get(resolved.family_id)
+    drawer = get_family_drawer(resolved.family_id)
     if drawer is None:
         return
 
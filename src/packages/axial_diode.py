@@ -1,5 +1,7 @@
 # file: src/packages/axial_diode.py
 
+from typing import Optional
+
 from reportlab.lib.colors import black
 from reportlab.pdfgen.canvas import Canvas
 
@@ -93,6 +95,7 @@ def draw_axial_package(
     info: dict,
     material: str,
     show_labels: bool = True,
+    mount: Optional[str] = None,
 ) -> None:
     """
     @brief		Draw a cylindrical axial package in THT or MELF-style SMD form.
@@ -102,9 +105,12 @@ def draw_axial_package(
     @param info		Param dictionary (dimensions, mount, pad sizing)
     @param material	Material/colour selector (glass, epoxy, metallic, blue)
     @param show_labels	Draw A/K labels
+    @param mount	Mount style ("tht" or "smd"), overrides info["mount"]
     @return		None
     """
-    mount_style = str(info.get("mount", "tht")).strip().lower()
+    if mount is None:
+        mount = info.get("mount", "tht")
+    mount_style = str(mount).strip().lower()
 
     body_length_mm = float(info.get("body_length", info.get("len", 0.0)))
     body_diameter_mm = float(info.get("body_diameter", info.get("dia", 0.0)))
@@ -4,20 +4,36 @@ from reportlab.pdfgen.canvas import Canvas
 from reportlab.lib.colors import gray, HexColor, toColor
 
 
+_RESISTOR_COLOURS = (
+    HexColor("#000000"),
+    HexColor("#964B00"),
+    HexColor("#FF3030"),
+    HexColor("#FFA500"),
+    HexColor("#FFFF00"),
+    HexColor("#00FF00"),
+    HexColor("#0000FF"),
+    HexColor("#C520F6"),
+    HexColor("#808080"),
+    HexColor("#FFFFFF"),
+)
+
+_GOLD_STRIPE = (
+    HexColor("#FFF0A0"),
+    HexColor("#FFE55C"),
+    HexColor("#FFD700"),
+    HexColor("#D1B000"),
+)
+
+_SILVER_STRIPE = (
+    HexColor("#D0D0D0"),
+    HexColor("#A9A9A9"),
+    HexColor("#929292"),
+    HexColor("#7B7B7B"),
+)
+
+
 def _resistor_color_table(num: int) -> HexColor:
-    table = [
-        HexColor("#000000"),
-        HexColor("#964B00"),
-        HexColor("#FF3030"),
-        HexColor("#FFA500"),
-        HexColor("#FFFF00"),
-        HexColor("#00FF00"),
-        HexColor("#0000FF"),
-        HexColor("#C520F6"),
-        HexColor("#808080"),
-        HexColor("#FFFFFF"),
-    ]
-    return table[num]
+    return _RESISTOR_COLOURS[num]
 
 
 def _draw_fancy_stripe(
@@ -65,24 +81,12 @@ def draw_resistor_stripe(
         return
 
     if value == -1:  # gold
-        gold = [
-            HexColor("#FFF0A0"),
-            HexColor("#FFE55C"),
-            HexColor("#FFD700"),
-            HexColor("#D1B000"),
-        ]
-        _draw_fancy_stripe(canvas, x, y, width, height, gold)
+        _draw_fancy_stripe(canvas, x, y, width, height, _GOLD_STRIPE)
         _draw_stripe_border(canvas, x, y, width, height)
         return
 
     if value == -2:  # silver
-        silver = [
-            HexColor("#D0D0D0"),
-            HexColor("#A9A9A9"),
-            HexColor("#929292"),
-            HexColor("#7B7B7B"),
-        ]
-        _draw_fancy_stripe(canvas, x, y, width, height, silver)
+        _draw_fancy_stripe(canvas, x, y, width, height, _SILVER_STRIPE)
         _draw_stripe_border(canvas, x, y, width, height)
         return
 
@@ -7,6 +7,7 @@ from src.core.geometry import simple_rect, scale_physical
 from src.core.colour import wavelength_to_rgb
 
 PACKAGE_SCALE = 2.0
+GLOW_MIN_RADIUS = 0.5
 
 
 def draw_led_tht(
@@ -84,12 +85,22 @@ def draw_led_tht(
     # -----------------------------------------------------------------
     # Helpers
     # -----------------------------------------------------------------
+    # Consecutive fills often share a colour (both leads, each metal part's
+    # rect and triangle); only emit a fill state change when it differs.
+    last_fill = None
+
+    def set_fill(rgb, a):
+        nonlocal last_fill
+        if last_fill != (rgb, a):
+            canvas.setFillColorRGB(*rgb, alpha=a)
+            last_fill = (rgb, a)
+
     def fill_rect(x, y, w, h, rgb, a=1.0):
-        canvas.setFillColorRGB(*rgb, alpha=a)
+        set_fill(rgb, a)
         canvas.rect(x, y, w, h, fill=1, stroke=0)
 
     def fill_path(path, rgb, a=1.0):
-        canvas.setFillColorRGB(*rgb, alpha=a)
+        set_fill(rgb, a)
         canvas.drawPath(path, fill=1, stroke=0)
 
     # -----------------------------------------------------------------
@@ -176,6 +187,8 @@ def draw_led_tht(
             f = i / glow_layers
             alpha = 0.50 * (1.0 - f * 0.65)
             radius = glow_r * f
+            if radius < GLOW_MIN_RADIUS:
+                continue
             canvas.setFillColorRGB(r, g, b, alpha=alpha)
             canvas.circle(dome_cx, dome_cy, radius, fill=1, stroke=0)
 
@@ -5,7 +5,7 @@
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Mapping, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -17,8 +17,8 @@ class resolved_package_t:
     @param canonical_id	Canonical outline id (eg "TO-220-AB")
     @param print_id	Canonical id to print (variant if present)
     @param family_id	Renderer family id, None if not renderable yet
-    @param params	Merged mechanical parameters for the family
-    @param qualifiers	Non-print qualifiers (eg ["epoxy", "fullpack"])
+    @param params	Merged mechanical parameters for the family (read-only)
+    @param qualifiers	Non-print qualifiers (eg ("epoxy", "fullpack"))
     @param is_renderableTrue if a family is assigned and registered
     """
 
@@ -26,6 +26,6 @@ class resolved_package_t:
     canonical_id: str
     print_id: str
     family_id: Optional[str]
-    params: Dict[str, Any]
-    qualifiers: List[str]
+    params: Mapping[str, Any]
+    qualifiers: Tuple[str, ...]
     is_renderable: bool
@@ -7,77 +7,126 @@
         aliases and variants resolve to canonical ids.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 
-outline_t = dict[str, Any]
-
-OUTLINES: Dict[str, outline_t] = {}
-PACKAGE_ALIASES: Dict[str, str] = {}
-PACKAGE_VARIANTS: Dict[str, dict[str, Any]] = {}
+class outline_t(NamedTuple):
+    """
+    @brief		Outline registry record.
 
+    @param id		Canonical outline id
+    @param domain	"DO", "TO" or another taxonomy domain
+    @param group	Grouping label
+    @param family_id	Renderer family id, None if not renderable
+    @param params	Mechanical params for the family
+    """
 
+    id: str
+    domain: str
+    group: str
+    family_id: Optional[str] = None
+    params: Optional[dict[str, Any]] = None
+
+
+# Tables are seeded on first use; the public names (OUTLINES, PACKAGE_ALIASES,
+# ...) are served by the module __getattr__ below.
+_OUTLINES: Dict[str, outline_t] = {}
+_PACKAGE_ALIASES: Dict[str, str] = {}
+_PACKAGE_VARIANTS: Dict[str, dict[str, Any]] = {}
+
+# Raw (un-normalised) alias spellings as registered, so lookups using the
+# exact spelling from the tables skip normalisation entirely.
+_PACKAGE_ALIAS_RAW: Dict[str, str] = {}
+_PACKAGE_VARIANT_RAW: Dict[str, dict[str, Any]] = {}
+
+# Unified resolver table: normalised key -> (kind, payload). Where a key is
+# registered more than once, variant beats alias beats canonical outline.
+RESOLVE_CANON = 0
+RESOLVE_ALIAS = 1
+RESOLVE_VARIANT = 2
+
+_RESOLVE: Dict[str, Tuple[int, Any]] = {}
+_RESOLVE_RAW: Dict[str, Tuple[int, Any]] = {}
+
+# Fallback for spellings that miss the table: the "L" of a dash-separated
+# lead count after the package number ("TO-220-5L", not "TO-92L") is
+# dropped when the stem resolves, and a dash
+# between a letter run and a digit run is optional ("TO220-5", "TO-220F"),
+# so alias lists only need one spelling per variant. Dashes inside a digit
+# run are kept ("TO-2-20" is not "TO-220"), and compact keys that would be
+# ambiguous are left out of _RESOLVE_COMPACT.
+_LEAD_SUFFIX_RE = re.compile(r"\d[A-Z-]*-\d+L$")
+_COMPACT_DASH_RE = re.compile(r"(?<=[A-Z])-(?=\d)|(?<=\d)-(?=[A-Z])")
+_RESOLVE_COMPACT: Dict[str, Tuple[int, Any]] = {}
+
+# Reverse indexes, built once after seeding.
+_CANONICAL_TO_ALIASES: Dict[str, Tuple[str, ...]] = {}
+_GROUP_TO_IDS: Dict[str, Tuple[str, ...]] = {}
+
+_SEEDED = False
+
+
+# Shared values used across many table entries.
+_EPOXY = sys.intern("epoxy")
+_GLASS = sys.intern("glass")
+_METALLIC = sys.intern("metallic")
+_INSULATED = sys.intern("insulated")
+_DOM_DO = sys.intern("DO")
+_DOM_TO = sys.intern("TO")
+_DOM_GEN = sys.intern("GEN")
+
+# Upper-cases ASCII letters and drops spaces/underscores in a single pass.
+_ALIAS_TRANS = str.maketrans(
+    {c: c.upper() for c in "abcdefghijklmnopqrstuvwxyz"} | {" ": None, "_": None}
+)
+
+
+@lru_cache(maxsize=1024)
 def _normalise_alias_key(raw: str) -> str:
     """
     @brief	Normalise an alias lookup key.
 
+    		Cached, as runtime lookups repeat the same few spellings.
+
     @param raw	Input key
     @return	Normalised key suitable for lookups
     """
     if not raw:
         return ""
-    key = raw.strip().upper()
-    key = key.replace(" ", "")
-    key = key.replace("_", "")
-    return key
+    return raw.strip().translate(_ALIAS_TRANS)
 
 
-def _register_outline(
-    canonical_id: str,
-    *,
-    domain: str,
-    group: str,
-    family_id: Optional[str] = None,
-    params: Optional[dict[str, Any]] = None,
-    aliases: Optional[List[str]] = None,
-) -> None:
+def _alias_keys(aliases: Sequence[str]) -> List[Tuple[str, str]]:
     """
-    @brief		Register an outline, optionally renderable.
+    @brief		Pair each alias with its interned lookup key.
 
-    @param canonical_id	Canonical outline id
-    @param domain		"DO", "TO" or another taxonomy domain
-    @param group		Grouping label
-    @param family_id	Renderer family id
-    @param params		Mechanical params for the family
-    @param aliases		Optional alias strings
-    """
-    entry: outline_t = {
-        "id": canonical_id,
-        "domain": domain,
-        "group": group,
-    }
-    if family_id is not None:
-        entry["family_id"] = family_id
-    if params is not None:
-        entry["params"] = dict(params)
-
-    OUTLINES[canonical_id] = entry
-
-    if aliases:
-        for alias in aliases:
-            _register_alias(alias, canonical_id)
+    @param aliases	Alias strings
+    @return		(alias, key) pairs, aliases normalising to "" dropped
+    """
+    return [
+        (alias, sys.intern(key))
+        for alias in aliases
+        if (key := _normalise_alias_key(alias))
+    ]
 
 
-def _register_alias(alias: str, canonical_id: str) -> None:
+def _register_aliases(aliases: Sequence[str], canonical_id: str) -> None:
     """
-    @brief		Register a pure alias mapping to an outline.
+    @brief		Register pure alias mappings to an outline.
 
-    @param alias		Alias string
+    @param aliases		Alias strings
     @param canonical_id	Canonical outline id
     """
-    key = _normalise_alias_key(alias)
-    if key:
-        PACKAGE_ALIASES[key] = canonical_id
+    canonical_id = sys.intern(canonical_id)
+    pairs = _alias_keys(aliases)
+    _PACKAGE_ALIASES.update((key, canonical_id) for _, key in pairs)
+    _PACKAGE_ALIAS_RAW.update((alias, canonical_id) for alias, _ in pairs)
 
 
 def _register_variant(
@@ -85,7 +134,7 @@ def _register_variant(
     base_id: str,
     overrides: dict[str, Any],
     *,
-    aliases: Optional[List[str]] = None,
+    aliases: Optional[Sequence[str]] = None,
 ) -> None:
     """
     @brief		Register a variant of an outline.
@@ -95,427 +144,430 @@ def _register_variant(
 
     @param variant_id	Canonical variant id (printed id)
     @param base_id		Canonical base outline id
-    @param overrides	Mechanical override params
+    @param overrides	Mechanical override params, stored as a sorted
+    			(key, value) tuple and merged over the base params on
+    			resolve
     @param aliases		Optional alias strings mapping to this variant
     """
+    variant_id = sys.intern(variant_id)
     record = {
-        "base_id": base_id,
+        "base_id": sys.intern(base_id),
         "variant_id": variant_id,
-        "overrides": dict(overrides),
+        "overrides": tuple(sorted(overrides.items())),
     }
 
-    key = _normalise_alias_key(variant_id)
-    if key:
-        PACKAGE_VARIANTS[key] = dict(record)
+    # Variant ids are written in normalised form, so they key the tables
+    # directly.
+    assert variant_id == _normalise_alias_key(variant_id), variant_id
+    _PACKAGE_VARIANTS[variant_id] = record
+    _PACKAGE_VARIANT_RAW[variant_id] = record
 
     if aliases:
-        for alias in aliases:
-            alias_key = _normalise_alias_key(alias)
-            if alias_key:
-                PACKAGE_VARIANTS[alias_key] = dict(record)
+        pairs = _alias_keys(aliases)
+        _PACKAGE_VARIANTS.update((key, record) for _, key in pairs)
+        _PACKAGE_VARIANT_RAW.update((alias, record) for alias, _ in pairs)
 
 
-def _seed_full_outline_registry() -> None:
+def lookup_key(raw: str) -> Optional[Tuple[int, Any]]:
     """
-    @brief	Seed OUTLINES with known canonical list.
+    @brief	Resolve a raw key against the unified resolver table.
 
-            This registers every outline as known, but not necessarily renderable.
-            Renderable outlines are then overridden with family and params.
-    """
-    do_groups: List[Tuple[str, List[str]]] = [
-        ("Button Rectifier", ["DO-217"]),
-        ("Disc Type", ["DO-200"]),
-        ("Flanged Mount Family", ["DO-211"]),
-        ("Leadless Family", ["DO-213"]),
-        ("Lead Mounted Family", ["DO-204"]),
-        (
-            "Plastic Surface-Mount Family",
-            [
-                "DO-214",
-                "DO-215",
-                "DO-216",
-                "DO-218",
-                "DO-219",
-                "DO-220",
-                "DO-221",
-                "DO-222",
-            ],
-        ),
-        (
-            "Round Body Axial Lead",
-            [
-                "DO-201-AA",
-                "DO-202-AA",
-                "DO-204-AA",
-                "DO-204-AC",
-                "DO-204-AF",
-                "DO-204-AG",
-                "DO-204-AH",
-                "DO-204-AL",
-            ],
-        ),
-        ("Round Body Axial Type", ["DO-201"]),
-        ("Single-End Press-Fit", ["DO-208", "DO-209"]),
-        ("Stud-Hex Base", ["DO-203", "DO-205"]),
-        ("Terminal Stud Axial Lead", ["DO-203-AB"]),
-    ]
+    		The exact registered spelling is tried first, so only
+    		unseen spellings pay for normalisation.
 
-    for group, ids in do_groups:
-        for outline_id in ids:
-            _register_outline(outline_id, domain="DO", group=group)
+    @param raw	Raw outline id, alias or variant string
+    @return	(kind, payload) or None if unknown. payload is the outline
+    		entry for RESOLVE_CANON, the canonical id for RESOLVE_ALIAS and
+    		the variant record for RESOLVE_VARIANT.
+    """
+    _ensure_seeded()
+    hit = _RESOLVE_RAW.get(raw)
+    if hit is not None:
+        return hit
+    key = _normalise_alias_key(raw)
+    hit = _RESOLVE.get(key)
+    if hit is not None:
+        return hit
+    return _lookup_loose(key)
+
+
+def _compact_key(key: str) -> str:
+    """
+    @brief	Drop the dashes between letter and digit runs of a key.
 
-    to_groups: List[Tuple[str, List[str]]] = [
+    @param key	Normalised key
+    @return	Key as stored in _RESOLVE_COMPACT
+    """
+    return _COMPACT_DASH_RE.sub("", key)
+
+
+def _lookup_loose(key: str) -> Optional[Tuple[int, Any]]:
+    """
+    @brief	Retry a missed key without lead suffix and optional dashes.
+
+    @param key	Normalised key that missed the resolver table
+    @return	(kind, payload) or None if still unknown
+    """
+    if _LEAD_SUFFIX_RE.search(key):
+        stem = key[:-1]
+        hit = _RESOLVE.get(stem)
+        if hit is None:
+            hit = _RESOLVE_COMPACT.get(_compact_key(stem))
+        if hit is not None:
+            return hit
+    return _RESOLVE_COMPACT.get(_compact_key(key))
+
+
+def lookup_outline(canonical_id: str) -> Optional[outline_t]:
+    """
+    @brief		Look up an outline entry by canonical id.
+
+    @param canonical_id	Canonical outline id (already normalised)
+    @return		Outline entry, or None if unknown
+    """
+    _ensure_seeded()
+    return _OUTLINES.get(canonical_id)
+
+
+# Known outlines by domain: (group, ids)
+_DO_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Button Rectifier", ("DO-217",)),
+    ("Disc Type", ("DO-200",)),
+    ("Flanged Mount Family", ("DO-211",)),
+    ("Leadless Family", ("DO-213",)),
+    ("Lead Mounted Family", ("DO-204",)),
+    (
+        "Plastic Surface-Mount Family",
         (
-            "Axial Leads",
-            [
-                "TO-9",
-                "TO-42",
-                "TO-72",
-                "TO-73",
-                "TO-74",
-                "TO-75",
-                "TO-76",
-                "TO-77",
-                "TO-78",
-                "TO-79",
-                "TO-80",
-                "TO-96",
-                "TO-97",
-                "TO-99",
-                "TO-100",
-                "TO-101",
-                "TO-205-AA",
-                "TO-205-AB",
-                "TO-206-AA",
-                "TO-205-AC",
-                "TO-205-AD",
-                "TO-206-AB",
-                "TO-233-AA",
-            ],
+            "DO-214",
+            "DO-215",
+            "DO-216",
+            "DO-218",
+            "DO-219",
+            "DO-220",
+            "DO-221",
+            "DO-222",
         ),
-        ("Ceramic No Lead", ["TO-276"]),
-        ("Coaxial Type", ["TO-215"]),
-        ("Disc Type Family", ["TO-200"]),
+    ),
+    (
+        "Round Body Axial Lead",
         (
-            "Diamond Base",
-            [
-                "TO-37",
-                "TO-66",
-                "TO-204-AA",
-                "TO-204-AB",
-                "TO-213-AB",
-                "TO-213-AC",
-            ],
+            "DO-201-AA",
+            "DO-202-AA",
+            "DO-204-AA",
+            "DO-204-AC",
+            "DO-204-AF",
+            "DO-204-AG",
+            "DO-204-AH",
+            "DO-204-AL",
         ),
+    ),
+    ("Round Body Axial Type", ("DO-201",)),
+    ("Single-End Press-Fit", ("DO-208", "DO-209")),
+    ("Stud-Hex Base", ("DO-203", "DO-205")),
+    ("Terminal Stud Axial Lead", ("DO-203-AB",)),
+)
+
+_TO_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "Axial Leads",
         (
-            "Double-Ended Flatpack",
-            [
-                "TO-87",
-                "TO-88",
-                "TO-89",
-                "TO-90",
-                "TO-91",
-                "TO-95",
-            ],
+            "TO-9",
+            "TO-42",
+            "TO-72",
+            "TO-73",
+            "TO-74",
+            "TO-75",
+            "TO-76",
+            "TO-77",
+            "TO-78",
+            "TO-79",
+            "TO-80",
+            "TO-96",
+            "TO-97",
+            "TO-99",
+            "TO-100",
+            "TO-101",
+            "TO-205-AA",
+            "TO-205-AB",
+            "TO-206-AA",
+            "TO-205-AC",
+            "TO-205-AD",
+            "TO-206-AB",
+            "TO-233-AA",
         ),
-        ("Dual-in-Package", ["TO-250"]),
+    ),
+    ("Ceramic No Lead", ("TO-276",)),
+    ("Coaxial Type", ("TO-215",)),
+    ("Disc Type Family", ("TO-200",)),
+    (
+        "Diamond Base",
         (
-            "Flange-Mounted Header Family",
-            [
-                "TO-204",
-                "TO-213",
-                "TO-218",
-                "TO-219",
-                "TO-220",
-                "TO-238",
-                "TO-257",
-                "TO-258",
-                "TO-259",
-                "TO-262",
-                "TO-264",
-                "TO-267",
-                "TO-280",
-                "TO-281",
-            ],
+            "TO-37",
+            "TO-66",
+            "TO-204-AA",
+            "TO-204-AB",
+            "TO-213-AB",
+            "TO-213-AC",
         ),
-        ("Flange-Mounted Package", ["TO-273"]),
-        ("Flange-Mounted Peripheral Terminal", ["TO-247", "TO-254"]),
-        ("Flange-Mounted Rectangular Base", ["TO-244"]),
-        ("Flat Index Axial Leaded", ["TO-92"]),
-        ("Flat Leads", ["TO-225-AA", "TO-232-AA"]),
-        ("Flat Mounted Transistor", ["TO-256", "TO-282"]),
-        ("Flexible Terminals", ["TO-209"]),
+    ),
+    ("Double-Ended Flatpack", ("TO-87", "TO-88", "TO-89", "TO-90", "TO-91", "TO-95")),
+    ("Dual-in-Package", ("TO-250",)),
+    (
+        "Flange-Mounted Header Family",
         (
-            "Header Family",
-            [
-                "TO-205",
-                "TO-206",
-                "TO-236",
-                "TO-237",
-                "TO-243",
-                "TO-251",
-                "TO-252",
-                "TO-260",
-                "TO-263",
-                "TO-268",
-                "TO-279",
-            ],
+            "TO-204",
+            "TO-213",
+            "TO-218",
+            "TO-219",
+            "TO-220",
+            "TO-238",
+            "TO-257",
+            "TO-258",
+            "TO-259",
+            "TO-262",
+            "TO-264",
+            "TO-267",
+            "TO-280",
+            "TO-281",
         ),
-        ("Multiple-Ended Flatpack", ["TO-84", "TO-85", "TO-86"]),
-        ("Opto Family Insertion Mount", ["TO-266"]),
-        ("Plastic Clip Mounted Package", ["TO-274"]),
-        ("Power Package", ["TO-265", "TO-270", "TO-272", "TO-275"]),
-        ("Quad Flack Pack Surface Mount", ["TO-271"]),
-        ("Small Outline", ["TO-269"]),
-        ("Small Outline Transistor (SOT)", ["TO-253", "TO-261"]),
-        ("Solid Terminals", ["TO-208"]),
-        ("Stud-Mount Flex Lead", ["TO-94"]),
-        ("Stud-Mounted Stripline", ["TO-216"]),
-        ("Tab-Mounted Peripheral Leads", ["TO-202"]),
-        ("Terminal Strip Power Module", ["TO-240"]),
-    ]
+    ),
+    ("Flange-Mounted Package", ("TO-273",)),
+    ("Flange-Mounted Peripheral Terminal", ("TO-247", "TO-254")),
+    ("Flange-Mounted Rectangular Base", ("TO-244",)),
+    ("Flat Index Axial Leaded", ("TO-92",)),
+    ("Flat Leads", ("TO-225-AA", "TO-232-AA")),
+    ("Flat Mounted Transistor", ("TO-256", "TO-282")),
+    ("Flexible Terminals", ("TO-209",)),
+    (
+        "Header Family",
+        (
+            "TO-205",
+            "TO-206",
+            "TO-236",
+            "TO-237",
+            "TO-243",
+            "TO-251",
+            "TO-252",
+            "TO-260",
+            "TO-263",
+            "TO-268",
+            "TO-279",
+        ),
+    ),
+    ("Multiple-Ended Flatpack", ("TO-84", "TO-85", "TO-86")),
+    ("Opto Family Insertion Mount", ("TO-266",)),
+    ("Plastic Clip Mounted Package", ("TO-274",)),
+    ("Power Package", ("TO-265", "TO-270", "TO-272", "TO-275")),
+    ("Quad Flack Pack Surface Mount", ("TO-271",)),
+    ("Small Outline", ("TO-269",)),
+    ("Small Outline Transistor (SOT)", ("TO-253", "TO-261")),
+    ("Solid Terminals", ("TO-208",)),
+    ("Stud-Mount Flex Lead", ("TO-94",)),
+    ("Stud-Mounted Stripline", ("TO-216",)),
+    ("Tab-Mounted Peripheral Leads", ("TO-202",)),
+    ("Terminal Strip Power Module", ("TO-240",)),
+)
+
+_GEN_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Axial Diode", ("R-6", "T-18")),
+)
+
+
+def _bulk_register(
+    domain: str,
+    groups: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> None:
+    """
+    @brief	Register plain (non-renderable) outlines, skipping known ids.
 
-    for group, ids in to_groups:
+    @param domain	Taxonomy domain for every outline in groups
+    @param groups	(group, ids) pairs
+    """
+    outlines = _OUTLINES
+    intern = sys.intern
+    domain = intern(domain)
+    for group, ids in groups:
+        group = intern(group)
         for outline_id in ids:
-            _register_outline(outline_id, domain="TO", group=group)
-
-    gen_groups: List[Tuple[str, List[str]]] = [
-        ("Axial Diode", ["R-6"]),
-        ("Axial Diode", ["T-18"]),
-    ]
-
-    for group, ids in gen_groups:
-        for i in ids:
-            _register_outline(i, domain="GEN", group=group)
+            if outline_id not in outlines:
+                outline_id = intern(outline_id)
+                outlines[outline_id] = outline_t(outline_id, domain, group)
 
 
-def _seed_current_renderables() -> None:
+def _seed_full_outline_registry() -> None:
     """
-    @brief	Seed renderable outline mappings to existing families.
+    @brief	Seed OUTLINES with known canonical list.
+
+            This registers every outline as known, but not necessarily renderable.
+            Runs after the renderables are seeded, and skips ids already
+            registered so renderable entries are not built twice.
     """
-    axial_family = "axial_round_body"
+    _bulk_register(_DOM_DO, _DO_GROUPS)
+    _bulk_register(_DOM_TO, _TO_GROUPS)
+    _bulk_register(_DOM_GEN, _GEN_GROUPS)
 
-    _register_outline(
-        "DO-201-AA",
-        domain="DO",
-        group="Round Body Axial Lead",
-        family_id=axial_family,
-        params={"len": 8.35, "dia": 5.3, "material": "epoxy"},
-        aliases=["DO-27"],
-    )
 
-    _register_outline(
+# Renderable outlines: (canonical_id, domain, group, family_id, params, aliases)
+_AXIAL_FAMILY = "axial_round_body"
+
+_RENDERABLE_OUTLINES: Tuple[
+    Tuple[str, str, str, str, dict[str, Any], Tuple[str, ...]], ...
+] = (
+    (
+        "DO-201-AA",
+        _DOM_DO,
+        "Round Body Axial Lead",
+        _AXIAL_FAMILY,
+        {"len": 8.35, "dia": 5.3, "material": _EPOXY},
+        ("DO-27",),
+    ),
+    (
         "DO-204-AH",
-        domain="DO",
-        group="Round Body Axial Lead",
-        family_id=axial_family,
-        params={"len": 3.9, "dia": 1.7, "material": "glass"},
-        aliases=["DO-35"],
-    )
-    _register_outline(
+        _DOM_DO,
+        "Round Body Axial Lead",
+        _AXIAL_FAMILY,
+        {"len": 3.9, "dia": 1.7, "material": _GLASS},
+        ("DO-35",),
+    ),
+    (
         "DO-204-AL",
-        domain="DO",
-        group="Round Body Axial Lead",
-        family_id=axial_family,
-        params={"len": 4.7, "dia": 2.7, "material": "epoxy"},
-        aliases=["DO-41"],
-    )
-    _register_outline(
+        _DOM_DO,
+        "Round Body Axial Lead",
+        _AXIAL_FAMILY,
+        {"len": 4.7, "dia": 2.7, "material": _EPOXY},
+        ("DO-41",),
+    ),
+    (
         "DO-204-AC",
-        domain="DO",
-        group="Round Body Axial Lead",
-        family_id=axial_family,
-        params={"len": 7.0, "dia": 3.6, "material": "epoxy"},
-        aliases=["DO-15"],
-    )
-    _register_outline(
+        _DOM_DO,
+        "Round Body Axial Lead",
+        _AXIAL_FAMILY,
+        {"len": 7.0, "dia": 3.6, "material": _EPOXY},
+        ("DO-15",),
+    ),
+    (
         "DO-204-AF",
-        domain="DO",
-        group="Round Body Axial Lead",
-        family_id=axial_family,
-        params={"len": 9.5, "dia": 5.3, "material": "epoxy"},
-        aliases=["DO-29"],
-    )
-    _register_outline(
+        _DOM_DO,
+        "Round Body Axial Lead",
+        _AXIAL_FAMILY,
+        {"len": 9.5, "dia": 5.3, "material": _EPOXY},
+        ("DO-29",),
+    ),
+    (
         "DO-201-AD",
-        domain="DO",
-        group="Round Body Axial Type",
-        family_id=axial_family,
-        params={"len": 9.0, "dia": 5.1, "material": "epoxy"},
-        aliases=["DO-201"],
-    )
-
-    _register_outline(
+        _DOM_DO,
+        "Round Body Axial Type",
+        _AXIAL_FAMILY,
+        {"len": 9.0, "dia": 5.1, "material": _EPOXY},
+        ("DO-201",),
+    ),
+    (
         "TO-92",
-        domain="TO",
-        group="Flat Index Axial Leaded",
-        family_id="to92_moulded",
-        params={
+        _DOM_TO,
+        "Flat Index Axial Leaded",
+        "to92_moulded",
+        {
             "pin_count": 3,
             "body_w": 4.8,
             "body_h": 4.8,
             "lead_len": 11.0,
             "lead_pitch": 1.27,
         },
-        aliases=["TO92"],
-    )
-
-    _register_outline(
+        ("TO92",),
+    ),
+    (
         "TO-204-AA",
-        domain="TO",
-        group="Diamond Base",
-        family_id="to204_diamond",
-        params={
+        _DOM_TO,
+        "Diamond Base",
+        "to204_diamond",
+        {
             "pin_count": 2,
             "pin_arc_start_deg": 65.0,
             "pin_arc_stop_deg": -65.0,
             "pin_diameter_mm": 1.0,
             "is_body_pin": True,
         },
-        aliases=["TO-3", "TO3"],
-    )
-
-    _register_outline(
+        ("TO-3",),
+    ),
+    (
         "TO-205-AD",
-        domain="TO",
-        group="Axial Leads",
-        family_id="to205_package",
-        params={
+        _DOM_TO,
+        "Axial Leads",
+        "to205_package",
+        {
             "pin_count": 3,
             "pin_diameter_mm": 1.0,
             "pin_connected_to_body": 3,
         },
-        aliases=["TO-205", "TO205", "TO-39", "TO39"],
-    )
-
-    _register_outline(
+        ("TO-205", "TO-39"),
+    ),
+    (
         "TO-206-AA",
-        domain="TO",
-        group="Axial Leads",
-        family_id="to206_package",
-        params={
+        _DOM_TO,
+        "Axial Leads",
+        "to206_package",
+        {
             "pin_count": 3,
             "pin_diameter_mm": 1.0,
             "pin_connected_to_body": 3,
         },
-        aliases=["TO-206", "TO206", "TO-18", "TO18"],
-    )
-
-    _register_outline(
+        ("TO-206", "TO-18"),
+    ),
+    (
         "TO-218-AA",
-        domain="TO",
-        group="Flat Leads",
-        family_id="to218_tab",
-        params={"pin_count": 3, "tab_is_pin": True},
-        aliases=["TO-218"],
-    )
-    _register_variant(
-        "TO-218-5",
-        "TO-218-AA",
-        {"pin_count": 5, "tab_is_pin": True},
-    )
-
-    _register_outline(
+        _DOM_TO,
+        "Flat Leads",
+        "to218_tab",
+        {"pin_count": 3, "tab_is_pin": True},
+        ("TO-218",),
+    ),
+    (
         "TO-225-AA",
-        domain="TO",
-        group="Flat Leads",
-        family_id="to225_tab",
-        params={"pin_count": 3, "tab_is_pin": True},
-        aliases=["TO-126", "TO126"],
-    )
-
-    _register_outline(
-        "TO-220-AB",
-        domain="TO",
-        group="Flange-Mounted Header Family",
-        family_id="to220_tab",
-        params={"pin_count": 3, "tab_is_pin": True, "tab_finish": "metallic"},
-        aliases=["TO-220", "TO220"],
-    )
-    _register_variant(
-        "TO-220-AA",
-        "TO-220-AB",
-        {"pin_count": 3, "tab_is_pin": False, "tab_finish": "metallic"},
-    )
-    _register_variant(
-        "TO-220-AC",
-        "TO-220-AB",
-        {"pin_count": 2, "tab_is_pin": True, "tab_finish": "metallic"},
-    )
-    _register_variant(
-        "TO-220-AB-5L",
-        "TO-220-AB",
-        {"pin_count": 5},
-        aliases=["TO-220-5", "TO220-5", "TO-220-5L"],
-    )
-    _register_variant(
-        "TO-220-AB-6L",
-        "TO-220-AB",
-        {"pin_count": 6},
-        aliases=["TO-220-6", "TO220-6", "TO-220-6L"],
-    )
-    _register_variant(
-        "TO-220-AB-7L",
-        "TO-220-AB",
-        {"pin_count": 7},
-        aliases=["TO-220-7", "TO220-7", "TO-220-7L"],
-    )
-    _register_variant(
-        "TO-220-F",
+        _DOM_TO,
+        "Flat Leads",
+        "to225_tab",
+        {"pin_count": 3, "tab_is_pin": True},
+        ("TO-126",),
+    ),
+    (
         "TO-220-AB",
-        {"pin_count": 3, "tab_is_pin": True, "tab_finish": "insulated"},
-        aliases=["TO220F", "TO-220F"],
-    )
-
-    _register_outline(
+        _DOM_TO,
+        "Flange-Mounted Header Family",
+        "to220_tab",
+        {"pin_count": 3, "tab_is_pin": True, "tab_finish": _METALLIC},
+        ("TO-220",),
+    ),
+    (
         "TO-243-AA",
-        domain="TO",
-        group="Header Family",
-        family_id="to243_tab",
-        params={
+        _DOM_TO,
+        "Header Family",
+        "to243_tab",
+        {
             "body_w": 4.5,
             "body_h": 2.76,
         },
-        aliases=["TO243", "SOT-89", "SOT89"],
-    )
-    _register_variant(
-        "TO-243-AB",
-        "TO-243-AA",
-        {"pin_count": 3},
-        aliases=["TO243AB", "SOT-89-2", "SOT89-2"],
-    )
-    _register_variant(
-        "TO-243-6",
-        "TO-243-AA",
-        {"pin_count": 6},
-        aliases=["TO243-6", "SOT-89-6", "SOT89-6"],
-    )
-
-    _register_outline(
+        ("TO243", "SOT-89"),
+    ),
+    (
         "TO-247",
-        domain="TO",
-        group="Flange-Mounted Peripheral Terminal",
-        family_id="to247_tab",
-        params={
+        _DOM_TO,
+        "Flange-Mounted Peripheral Terminal",
+        "to247_tab",
+        {
             "pin_count": 3,
             "body_w": 20.0,
             "body_h": 15.6,
             "lead_len": 20.0,
         },
-        aliases=["TO247"],
-    )
-    _register_variant(
-        "TO-247-4",
-        "TO-247",
-        {"pin_count": 4},
-    )
-
-    _register_outline(
+        ("TO247",),
+    ),
+    (
         "TO-264",
-        domain="TO",
-        group="Flange-Mounted Header Family",
-        family_id="to264_body",
-        params={
+        _DOM_TO,
+        "Flange-Mounted Header Family",
+        "to264_body",
+        {
             "body_mm": 20.0,
             "height_mm": 26.0,
             "lead_mm": 20.0,
@@ -525,69 +577,51 @@ def _seed_current_renderables() -> None:
             "pin_count": 3,
             "pin_pitch_mm": 5.75,
         },
-        aliases=["TO264", "TO-264AA", "TO-3P"],
-    )
-
-    _register_variant(
-        "TO-264-2",
-        "TO-264",
-        {"pin_count": 2},
-        aliases=["TO264-2", "TO-264-2L"],
-    )
-
-    _register_variant(
-        "TO-264-5",
-        "TO-264",
-        {"pin_count": 5, "pin_pitch_mm": 3.81},
-        aliases=["TO264-5", "TO-264-5L"],
-    )
-
-    _register_outline(
+        ("TO264", "TO-264AA", "TO-3P"),
+    ),
+    (
         "DO-213-AB",
-        domain="DO",
-        group="Leadless Family",
-        family_id="melf",
-        params={
+        _DOM_DO,
+        "Leadless Family",
+        "melf",
+        {
             "body_length": 5,
             "body_diameter": 2.4,
             "pad_width": 0.55,
-            "material": "glass",
+            "material": _GLASS,
         },
-        aliases=["MELF", "MMB", "SOD-106"],
-    )
-
-    for outline_id, params, aliases in [
-        (
-            "DO-214-AC",
-            {"body_w": 4.3, "body_h": 2.6, "pad_w": 1.2, "pad_h": 1.45},
-            ["SMA"],
-        ),
-        (
-            "DO-214-AA",
-            {"body_w": 4.32, "body_h": 3.62, "pad_w": 1.2, "pad_h": 2.1},
-            ["SMB"],
-        ),
-        (
-            "DO-214-AB",
-            {"body_w": 6.86, "body_h": 5.9, "pad_w": 1.2, "pad_h": 2.97},
-            ["SMC"],
-        ),
-    ]:
-        _register_outline(
-            outline_id,
-            domain="DO",
-            group="Plastic Surface-Mount Family",
-            family_id="smd_2pad",
-            params=params,
-            aliases=aliases,
-        )
-
-    _register_outline(
+        ("MELF", "MMB", "SOD-106"),
+    ),
+    (
+        "DO-214-AC",
+        _DOM_DO,
+        "Plastic Surface-Mount Family",
+        "smd_2pad",
+        {"body_w": 4.3, "body_h": 2.6, "pad_w": 1.2, "pad_h": 1.45},
+        ("SMA",),
+    ),
+    (
+        "DO-214-AA",
+        _DOM_DO,
+        "Plastic Surface-Mount Family",
+        "smd_2pad",
+        {"body_w": 4.32, "body_h": 3.62, "pad_w": 1.2, "pad_h": 2.1},
+        ("SMB",),
+    ),
+    (
+        "DO-214-AB",
+        _DOM_DO,
+        "Plastic Surface-Mount Family",
+        "smd_2pad",
+        {"body_w": 6.86, "body_h": 5.9, "pad_w": 1.2, "pad_h": 2.97},
+        ("SMC",),
+    ),
+    (
         "SOT-23",
-        domain="TO",
-        group="Small Outline Transistor (SOT)",
-        family_id="smd_3lead",
-        params={
+        _DOM_TO,
+        "Small Outline Transistor (SOT)",
+        "smd_3lead",
+        {
             "body_w": 2.9,
             "body_h": 1.3,
             "pad2_w": 0.4,
@@ -597,58 +631,14 @@ def _seed_current_renderables() -> None:
             "pad1_h": 0.6,
             "pin_count": 3,
         },
-        aliases=[
-            "SOT23",
-            "SOT-23-3",
-            "SOT23-3",
-            "TO-236",
-            "TO-236AA",
-            "SOT-23F",
-        ],
-    )
-
-    _register_variant(
-        "SOT-23-4",
-        "SOT-23",
-        {
-            "pin_count": 4,
-        },
-        aliases=["SOT23-4", "SOT-23-4L", "SOT23-4L"],
-    )
-
-    _register_variant(
-        "SOT-23-5",
-        "SOT-23",
-        {
-            "pin_count": 5,
-        },
-        aliases=["SOT23-5", "SOT-23-5L", "SOT23-5L"],
-    )
-
-    _register_variant(
-        "SOT-23-6",
-        "SOT-23",
-        {
-            "pin_count": 6,
-        },
-        aliases=["SOT23-6", "SOT-23-6L", "SOT23-6L"],
-    )
-
-    _register_variant(
-        "SOT-23-8",
-        "SOT-23",
-        {
-            "pin_count": 8,
-        },
-        aliases=["SOT23-8", "SOT-23-8L", "SOT23-8L"],
-    )
-
-    _register_outline(
+        ("SOT23", "SOT-23-3", "TO-236", "TO-236AA", "SOT-23F"),
+    ),
+    (
         "SOT-323",
-        domain="EIAJ",
-        group="Small Outline Transistor (SOT)",
-        family_id="smd_3lead",
-        params={
+        "EIAJ",
+        "Small Outline Transistor (SOT)",
+        "smd_3lead",
+        {
             "body_w": 2.2,
             "body_h": 1.35,
             "pad2_w": 0.4,
@@ -658,55 +648,219 @@ def _seed_current_renderables() -> None:
             "pad1_h": 0.525,
             "pin_count": 3,
         },
-        aliases=[
-            "SOT323",
-            "SOT-323-3",
-            "SOT323-3",
-            "SC-70",
-        ],
-    )
-
-    _register_outline(
+        ("SOT323", "SOT-323-3", "SC-70"),
+    ),
+    (
         "R-6",
-        domain="GEN",
-        group="Axial Diode",
-        family_id="axial_round_body",
-        params={
-            "len": 8.8,
-            "dia": 8.8,
-            "material": "epoxy",
-        },
-        aliases=["R6"],
-    )
-
-    _register_outline(
+        _DOM_GEN,
+        "Axial Diode",
+        _AXIAL_FAMILY,
+        {"len": 8.8, "dia": 8.8, "material": _EPOXY},
+        ("R6",),
+    ),
+    (
         "T-18",
-        domain="GEN",
-        group="Axial Diode",
-        family_id="axial_round_body",
-        params={
-            "len": 8.8,
-            "dia": 3.5,
-            "material": "epoxy",
-        },
-        aliases=["T18"],
-    )
-
-    _register_outline(
+        _DOM_GEN,
+        "Axial Diode",
+        _AXIAL_FAMILY,
+        {"len": 8.8, "dia": 3.5, "material": _EPOXY},
+        ("T18",),
+    ),
+    (
         "5MM ROUND T/H",
-        domain="IEC",
-        group="Leaded LED",
-        family_id="led_tht_round",
-        params={
+        "IEC",
+        "Leaded LED",
+        "led_tht_round",
+        {
             "body_d": 5.0,
             "body_h": 8.6,
             "lead_len": 17.0,
             "lead_pitch": 2.54,
             "lead_w": 0.6,
         },
-        aliases=["LED5MM", "5MMLED"],
+        ("LED5MM", "5MMLED"),
+    ),
+)
+
+# Variants: (variant_id, base_id, overrides, aliases)
+_RENDERABLE_VARIANTS: Tuple[
+    Tuple[str, str, dict[str, Any], Tuple[str, ...]], ...
+] = (
+    ("TO-218-5", "TO-218-AA", {"pin_count": 5, "tab_is_pin": True}, ()),
+    (
+        "TO-220-AA",
+        "TO-220-AB",
+        {"pin_count": 3, "tab_is_pin": False, "tab_finish": _METALLIC},
+        (),
+    ),
+    (
+        "TO-220-AC",
+        "TO-220-AB",
+        {"pin_count": 2, "tab_is_pin": True, "tab_finish": _METALLIC},
+        (),
+    ),
+    (
+        "TO-220-AB-5L",
+        "TO-220-AB",
+        {"pin_count": 5},
+        ("TO-220-5",),
+    ),
+    (
+        "TO-220-AB-6L",
+        "TO-220-AB",
+        {"pin_count": 6},
+        ("TO-220-6",),
+    ),
+    (
+        "TO-220-AB-7L",
+        "TO-220-AB",
+        {"pin_count": 7},
+        ("TO-220-7",),
+    ),
+    (
+        "TO-220-F",
+        "TO-220-AB",
+        {"pin_count": 3, "tab_is_pin": True, "tab_finish": _INSULATED},
+        (),
+    ),
+    (
+        "TO-243-AB",
+        "TO-243-AA",
+        {"pin_count": 3},
+        ("SOT-89-2",),
+    ),
+    (
+        "TO-243-6",
+        "TO-243-AA",
+        {"pin_count": 6},
+        ("SOT-89-6",),
+    ),
+    ("TO-247-4", "TO-247", {"pin_count": 4}, ()),
+    ("TO-264-2", "TO-264", {"pin_count": 2}, ()),
+    (
+        "TO-264-5",
+        "TO-264",
+        {"pin_count": 5, "pin_pitch_mm": 3.81},
+        (),
+    ),
+    ("SOT-23-4", "SOT-23", {"pin_count": 4}, ()),
+    ("SOT-23-5", "SOT-23", {"pin_count": 5}, ()),
+    ("SOT-23-6", "SOT-23", {"pin_count": 6}, ()),
+    ("SOT-23-8", "SOT-23", {"pin_count": 8}, ()),
+)
+
+
+def _seed_current_renderables() -> None:
+    """
+    @brief	Seed renderable outline mappings to existing families.
+    """
+    outlines = _OUTLINES
+    intern = sys.intern
+    register_aliases = _register_aliases
+    register_variant = _register_variant
+
+    for canonical_id, domain, group, family_id, params, aliases in (
+        _RENDERABLE_OUTLINES
+    ):
+        canonical_id = intern(canonical_id)
+        outlines[canonical_id] = outline_t(
+            canonical_id, intern(domain), intern(group), family_id, params
+        )
+        register_aliases(aliases, canonical_id)
+
+    for variant_id, base_id, overrides, aliases in _RENDERABLE_VARIANTS:
+        register_variant(variant_id, base_id, overrides, aliases=aliases)
+
+
+def _ensure_seeded() -> None:
+    """
+    @brief	Seed the registry on first use.
+    """
+    global _SEEDED
+    if _SEEDED:
+        return
+    _seed_current_renderables()
+    _seed_full_outline_registry()
+    _build_resolve_table()
+    _build_reverse_indexes()
+    _SEEDED = True
+
+
+def _build_resolve_table() -> None:
+    """
+    @brief	Build the unified resolver table from the seeded tables.
+
+            Tables are applied in increasing precedence so later kinds
+            overwrite earlier ones. Canonical ids are keyed verbatim, as
+            they are looked up against the normalised input.
+    """
+    _RESOLVE.update(
+        (canonical_id, (RESOLVE_CANON, entry))
+        for canonical_id, entry in _OUTLINES.items()
+    )
+    _RESOLVE.update(
+        (key, (RESOLVE_ALIAS, canonical_id))
+        for key, canonical_id in _PACKAGE_ALIASES.items()
+    )
+    _RESOLVE.update(
+        (key, (RESOLVE_VARIANT, record)) for key, record in _PACKAGE_VARIANTS.items()
     )
 
+    for raw in chain(_OUTLINES, _PACKAGE_ALIAS_RAW, _PACKAGE_VARIANT_RAW):
+        hit = _RESOLVE.get(_normalise_alias_key(raw))
+        if hit is not None:
+            _RESOLVE_RAW[raw] = hit
 
-_seed_full_outline_registry()
-_seed_current_renderables()
+    ambiguous = set()
+    for key, hit in _RESOLVE.items():
+        compact = _compact_key(key)
+        seen = _RESOLVE_COMPACT.setdefault(compact, hit)
+        if seen != hit:
+            ambiguous.add(compact)
+    for compact in ambiguous:
+        del _RESOLVE_COMPACT[compact]
+
+
+def _build_reverse_indexes() -> None:
+    """
+    @brief	Build canonical->aliases and group->ids from the seeded tables.
+    """
+    by_canonical: Dict[str, List[str]] = defaultdict(list)
+    for key, canonical_id in _PACKAGE_ALIASES.items():
+        by_canonical[canonical_id].append(key)
+    _CANONICAL_TO_ALIASES.update(
+        (canonical_id, tuple(keys)) for canonical_id, keys in by_canonical.items()
+    )
+
+    by_group: Dict[str, List[str]] = defaultdict(list)
+    for canonical_id, entry in _OUTLINES.items():
+        by_group[entry.group].append(canonical_id)
+    _GROUP_TO_IDS.update((group, tuple(ids)) for group, ids in by_group.items())
+
+
+# Public names are read-only views; only the _register_* helpers write to
+# the private dicts.
+_LAZY_TABLES: Dict[str, Mapping[str, Any]] = {
+    "OUTLINES": MappingProxyType(_OUTLINES),
+    "PACKAGE_ALIASES": MappingProxyType(_PACKAGE_ALIASES),
+    "PACKAGE_VARIANTS": MappingProxyType(_PACKAGE_VARIANTS),
+    "PACKAGE_ALIAS_RAW": MappingProxyType(_PACKAGE_ALIAS_RAW),
+    "PACKAGE_VARIANT_RAW": MappingProxyType(_PACKAGE_VARIANT_RAW),
+    "RESOLVE": MappingProxyType(_RESOLVE),
+    "CANONICAL_TO_ALIASES": MappingProxyType(_CANONICAL_TO_ALIASES),
+    "GROUP_TO_IDS": MappingProxyType(_GROUP_TO_IDS),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    @brief	Serve the registry tables, seeding them on first access.
+
+    @param name	Attribute name
+    @return	Seeded table
+    """
+    table = _LAZY_TABLES.get(name)
+    if table is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _ensure_seeded()
+    return table
@@ -1,29 +1,14 @@
 # file: src/packages/registry.py
 
-from types import SimpleNamespace
-from typing import Callable, Dict, Optional
+import importlib
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional
 
 from reportlab.pdfgen.canvas import Canvas
 
 from src.core.geometry import simple_rect
 from src.packages.model import resolved_package_t
 
-from src.packages.axial_diode import draw_axial_package
-from src.packages.to92 import draw_to92_package
-from src.packages.to204 import draw_to204_package
-from src.packages.to205 import draw_to205_package
-from src.packages.to206 import draw_to206_package
-from src.packages.to218 import draw_to218_package
-from src.packages.to220 import draw_to220_package
-from src.packages.to225 import draw_to225_package
-from src.packages.to243 import draw_to243_package
-from src.packages.to247 import draw_to247_package
-from src.packages.to264 import draw_to264_package
-from src.packages.smd2 import draw_smd2_package
-from src.packages.smd3 import draw_smd3_package
-from src.packages.smd4 import draw_smd4_package
-from src.packages.led_tht import draw_led_tht
-
 
 drawer_fn_t = Callable[
     [Canvas, simple_rect, resolved_package_t, Optional[object]],
@@ -32,6 +17,23 @@ drawer_fn_t = Callable[
 
 FAMILY_DRAWERS: Dict[str, drawer_fn_t] = {}
 
+# Bound lookup for the per-draw dispatch in api.draw_package.
+get_family_drawer = FAMILY_DRAWERS.get
+
+
+@lru_cache(maxsize=None)
+def _load_drawer(module_path: str, attr: str) -> Callable[..., None]:
+    """
+    @brief		Import a drawer module on first use and return its entry point.
+
+    		Drawer modules are only imported once a family is actually drawn.
+
+    @param module_path	Dotted module path
+    @param attr		Drawer function name in that module
+    @return		Drawer function
+    """
+    return getattr(importlib.import_module(module_path), attr)
+
 
 def register_family(family_id: str, drawer: drawer_fn_t) -> None:
     """
@@ -44,6 +46,27 @@ def register_family(family_id: str, drawer: drawer_fn_t) -> None:
         FAMILY_DRAWERS[family_id] = drawer
 
 
+class _params_proxy_t:
+    """
+    @brief	Read-through attribute view of package params.
+
+    		Avoids copying params per draw; pin metadata from the device
+    		spec is attached as slots. Missing names raise AttributeError
+    		so getattr() defaults in drawers keep working.
+    """
+
+    __slots__ = ("_params", "pin_config", "pin_labels")
+
+    def __init__(self, params: Mapping[str, Any]) -> None:
+        self._params = params
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._params[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
 def _merge_package_and_device_spec(
     pkg: resolved_package_t,
     device_spec: Optional[object],
@@ -57,21 +80,49 @@ def _merge_package_and_device_spec(
     @param device_spec	Optional device spec (pin_config etc)
     @return		Attribute object suitable for legacy package drawers
     """
-    ns = SimpleNamespace(**pkg.params)
+    ns = _params_proxy_t(pkg.params)
     if device_spec is None:
         return ns
 
     pin_config = getattr(device_spec, "pin_config", None)
     if pin_config is not None:
-        setattr(ns, "pin_config", pin_config)
+        ns.pin_config = pin_config
 
     pin_labels = getattr(device_spec, "pin_labels", None)
     if pin_labels is not None:
-        setattr(ns, "pin_labels", pin_labels)
+        ns.pin_labels = pin_labels
 
     return ns
 
 
+def _make_pincount_drawer(
+    module_path: str,
+    attr: str,
+    default_pin_count: int,
+) -> drawer_fn_t:
+    """
+    @brief			Build a wrapper for drawers taking (pin_count, spec).
+
+    @param module_path		Drawer module path, imported on first draw
+    @param attr			Drawer function name
+    @param default_pin_count	Pin count when params do not set one
+    @return			Family drawer
+    """
+
+    def _draw(
+        canvas: Canvas,
+        rect: simple_rect,
+        pkg: resolved_package_t,
+        spec: Optional[object],
+    ) -> None:
+        draw = _load_drawer(module_path, attr)
+        pin_count = int(pkg.params.get("pin_count", default_pin_count))
+        merged = _merge_package_and_device_spec(pkg, spec)
+        draw(canvas, rect, pin_count=pin_count, spec=merged)
+
+    return _draw
+
+
 def _draw_axial_round_body(
     canvas: Canvas,
     rect: simple_rect,
@@ -86,6 +137,7 @@ def _draw_axial_round_body(
     @param pkg		Resolved package
     @param spec		Optional device spec
     """
+    draw_axial_package = _load_drawer("src.packages.axial_diode", "draw_axial_package")
     material = str(pkg.params.get("material", ""))
     draw_axial_package(canvas, rect, pkg.params, material)
 
@@ -104,30 +156,11 @@ def _draw_melf(
     @param pkg		Resolved package
     @param spec		Optional device spec
     """
-    params = dict(pkg.params)
-    params["mount"] = "smd"
-
-    material = str(params.get("material", ""))
-    draw_axial_package(canvas, rect, params, material, show_labels=True)
-
-
-def _draw_to92_moulded(
-    canvas: Canvas,
-    rect: simple_rect,
-    pkg: resolved_package_t,
-    spec: Optional[object],
-) -> None:
-    """
-    @brief		Draw TO-92 moulded package.
-
-    @param canvas	ReportLab canvas
-    @param rect		Target rectangle
-    @param pkg		Resolved package
-    @param spec		Optional device spec
-    """
-    pin_count = int(pkg.params.get("pin_count", 3))
-    merged = _merge_package_and_device_spec(pkg, spec)
-    draw_to92_package(canvas, rect, pin_count=pin_count, spec=merged)
+    draw_axial_package = _load_drawer("src.packages.axial_diode", "draw_axial_package")
+    material = str(pkg.params.get("material", ""))
+    draw_axial_package(
+        canvas, rect, pkg.params, material, show_labels=True, mount="smd"
+    )
 
 
 def _draw_to204_diamond(
@@ -145,6 +178,7 @@ def _draw_to204_diamond(
     @param spec		Optional device spec
     @return		None
     """
+    draw_to204_package = _load_drawer("src.packages.to204", "draw_to204_package")
     pin_count = int(pkg.params.get("pin_count", 2))
     start_deg = float(pkg.params.get("pin_arc_start_deg", -55.0))
     stop_deg = float(pkg.params.get("pin_arc_stop_deg", 55.0))
@@ -163,98 +197,6 @@ def _draw_to204_diamond(
     )
 
 
-def _draw_to205_package(
-    canvas: Canvas,
-    rect: simple_rect,
-    pkg: resolved_package_t,
-    spec: Optional[object],
-) -> None:
-    """
-    @brief		Draw TO-205 package.
-    @param canvas	ReportLab canvas
-    @param rect		Target rectangle
-    @param pkg		Resolved package
-    @param spec		Optional device spec
-    """
-    pin_count = int(pkg.params.get("pin_count", 3))
-    merged = _merge_package_and_device_spec(pkg, spec)
-    draw_to205_package(canvas, rect, pin_count=pin_count, spec=merged)
-
-
-def _draw_to206_package(
-    canvas: Canvas,
-    rect: simple_rect,
-    pkg: resolved_package_t,
-    spec: Optional[object],
-) -> None:
-    """
-    @brief		Draw TO-206 package.
-    @param canvas	ReportLab canvas
-    @param rect		Target rectangle
-    @param pkg		Resolved package
-    @param spec		Optional device spec
-    """
-    pin_count = int(pkg.params.get("pin_count", 3))
-    merged = _merge_package_and_device_spec(pkg, spec)
-    draw_to206_package(canvas, rect, pin_count=pin_count, spec=merged)
-
-
-def _draw_to218_tab(
-    canvas: Canvas,
-    rect: simple_rect,
-    pkg: resolved_package_t,
-    spec: Optional[object],
-) -> None:
-    """
-    @brief		Draw TO-218 tabbed package.
-    @param canvas	ReportLab canvas
-    @param rect		Target rectangle
-    @param pkg		Resolved package
-    @param spec		Optional device spec
-    """
-    pin_count = int(pkg.params.get("pin_count", 2))
-    merged = _merge_package_and_device_spec(pkg, spec)
-    draw_to218_package(canvas, rect, pin_count=pin_count, spec=merged)
-
-
-def _draw_to220_tab(
-    canvas: Canvas,
-    rect: simple_rect,
-    pkg: resolved_package_t,
-    spec: Optional[object],
-) -> None:
-    """
-    @brief		Draw TO-220 tabbed package.
-
-    @param canvas	ReportLab canvas
-    @param rect		Target rectangle
-    @param pkg		Resolved package
-    @param spec		Optional device spec
-    """
-    pin_count = int(pkg.params.get("pin_count", 3))
-    merged = _merge_package_and_device_spec(pkg, spec)
-    draw_to220_package(canvas, rect, pin_count=pin_count, spec=merged)
-
-
-def _draw_to225_tab(
-    canvas: Canvas,
-    rect: simple_rect,
-    pkg: resolved_package_t,
-    spec: Optional[object],
-) -> None:
-    """
-    @brief		Draw TO-225 tabbed package.
-
-    @param canvas	ReportLab canvas
-    @param rect		Target rectangle
-    @param pkg		Resolved package
-    @param spec		Optional device spec
-    """
-    pin_count = int(pkg.params.get("pin_count", 3))
-    merged = _merge_package_and_device_spec(pkg, spec)
-    draw_to225_package(canvas, rect, pin_count=pin_count, spec=merged)
-
-
 def _draw_to243_tab(
     canvas: Canvas,
     rect: simple_rect,
@@ -270,40 +212,11 @@ def _draw_to243_tab(
     @param spec		Optional device spec
     @return		None
     """
+    draw_to243_package = _load_drawer("src.packages.to243", "draw_to243_package")
     merged = _merge_package_and_device_spec(pkg, spec)
     draw_to243_package(canvas, rect, pkg.params, spec=merged)
 
 
-def _draw_to247_tab(
-    canvas: Canvas,
-    rect: simple_rect,
-    pkg: resolved_package_t,
-    spec: Optional[object],
-) -> None:
-    """
-    @brief		Draw TO-247 tabbed package.
-
-    @param canvas	ReportLab canvas
-    @param rect		Target rectangle
-    @param pkg		Resolved package
-    @param spec		Optional device spec
-    """
-    pin_count = int(pkg.params.get("pin_count", 3))
-    merged = _merge_package_and_device_spec(pkg, spec)
-    draw_to247_package(canvas, rect, pin_count=pin_count, spec=merged)
-
-
-def _draw_to264_body(
-    canvas: Canvas,
-    rect: simple_rect,
-    pkg: resolved_package_t,
-    spec: Optional[object],
-) -> None:
-    pin_count = int(pkg.params.get("pin_count", 3))
-    merged = _merge_package_and_device_spec(pkg, spec)
-    draw_to264_package(canvas, rect, pin_count=pin_count, spec=merged)
-
-
 def _draw_smd_2pad(
     canvas: Canvas,
     rect: simple_rect,
@@ -318,6 +231,7 @@ def _draw_smd_2pad(
     @param pkg		Resolved package
     @param spec		Optional device spec
     """
+    draw_smd2_package = _load_drawer("src.packages.smd2", "draw_smd2_package")
     draw_smd2_package(
         canvas,
         rect,
@@ -341,6 +255,7 @@ def _draw_smd_3lead(
     @param pkg		Resolved package
     @param spec		Optional device spec
     """
+    draw_smd3_package = _load_drawer("src.packages.smd3", "draw_smd3_package")
     draw_smd3_package(
         canvas,
         rect,
@@ -364,6 +279,7 @@ def _draw_smd_4lead(
     @param pkg		Resolved package
     @param spec		Optional device spec
     """
+    draw_smd4_package = _load_drawer("src.packages.smd4", "draw_smd4_package")
     draw_smd4_package(
         canvas,
         rect,
@@ -387,21 +303,46 @@ def _draw_led_tht_round(
     @param pkg		Resolved package
     @param spec		Optional device spec
     """
+    draw_led_tht = _load_drawer("src.packages.led_tht", "draw_led_tht")
     draw_led_tht(canvas, rect, pkg.params, spec)
 
 
 register_family("axial_round_body", _draw_axial_round_body)
 register_family("melf", _draw_melf)
-register_family("to92_moulded", _draw_to92_moulded)
+register_family(
+    "to92_moulded",
+    _make_pincount_drawer("src.packages.to92", "draw_to92_package", 3),
+)
 register_family("to204_diamond", _draw_to204_diamond)
-register_family("to205_package", _draw_to205_package)
-register_family("to206_package", _draw_to206_package)
-register_family("to218_tab", _draw_to218_tab)
-register_family("to220_tab", _draw_to220_tab)
-register_family("to225_tab", _draw_to225_tab)
+register_family(
+    "to205_package",
+    _make_pincount_drawer("src.packages.to205", "draw_to205_package", 3),
+)
+register_family(
+    "to206_package",
+    _make_pincount_drawer("src.packages.to206", "draw_to206_package", 3),
+)
+register_family(
+    "to218_tab",
+    _make_pincount_drawer("src.packages.to218", "draw_to218_package", 2),
+)
+register_family(
+    "to220_tab",
+    _make_pincount_drawer("src.packages.to220", "draw_to220_package", 3),
+)
+register_family(
+    "to225_tab",
+    _make_pincount_drawer("src.packages.to225", "draw_to225_package", 3),
+)
 register_family("to243_tab", _draw_to243_tab)
-register_family("to247_tab", _draw_to247_tab)
-register_family("to264_body", _draw_to264_body)
+register_family(
+    "to247_tab",
+    _make_pincount_drawer("src.packages.to247", "draw_to247_package", 3),
+)
+register_family(
+    "to264_body",
+    _make_pincount_drawer("src.packages.to264", "draw_to264_package", 3),
+)
 register_family("smd_2pad", _draw_smd_2pad)
 register_family("smd_3lead", _draw_smd_3lead)
 register_family("smd_4lead", _draw_smd_4lead)
@@ -4,28 +4,37 @@
 @brief	Package resolver for canonical ids, variants and qualifiers.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
-
-from src.packages.outline_db import OUTLINES, PACKAGE_ALIASES, PACKAGE_VARIANTS
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.packages.outline_db import (
+    RESOLVE_ALIAS,
+    RESOLVE_VARIANT,
+    lookup_key,
+    lookup_outline,
+)
 from src.packages.model import resolved_package_t
 
 
-def _normalise_lookup(raw: str) -> str:
-    """
-    @brief	Normalise a package string for alias and variant lookups.
+# Qualifier token -> (param key, value) it sets. Unknown tokens are kept in
+# params["qualifiers"].
+_QUALIFIER_PARAMS: Dict[str, Tuple[str, str]] = {
+    "glass": ("material", "glass"),
+    "epoxy": ("material", "epoxy"),
+    "blue": ("material", "blue"),
+    "metallic": ("material", "metallic"),
+    "fullpack": ("tab_finish", "insulated"),
+    "insulated": ("tab_finish", "insulated"),
+    "f": ("tab_finish", "insulated"),
+}
 
-    @param raw	Raw key from label JSON
-    @return	Normalised key
-    """
-    if not raw:
-        return ""
-    key = raw.strip().upper()
-    key = key.replace(" ", "")
-    key = key.replace("_", "")
-    return key
+# Shared overrides for keys that carry none; read-only so no caller can
+# leak changes into another resolution.
+_EMPTY_OVERRIDES: Mapping[str, Any] = MappingProxyType({})
 
 
-def _split_qualifiers(raw: str) -> Tuple[str, List[str]]:
+def _split_qualifiers(raw: str) -> Tuple[str, Tuple[str, ...]]:
     """
     @brief	Split raw package key and non-print qualifiers.
 
@@ -35,7 +44,9 @@ def _split_qualifiers(raw: str) -> Tuple[str, List[str]]:
     @return	(base_key, qualifiers)
     """
     if not raw:
-        return "", []
+        return "", ()
+    if "@" not in raw:
+        return raw.strip(), ()
     parts = raw.split("@")
     base = parts[0].strip()
     qualifiers: List[str] = []
@@ -43,12 +54,12 @@ def _split_qualifiers(raw: str) -> Tuple[str, List[str]]:
         qt = q.strip().lower()
         if qt:
             qualifiers.append(qt)
-    return base, qualifiers
+    return base, tuple(qualifiers)
 
 
 def _apply_qualifiers(
     params: Dict[str, Any],
-    qualifiers: List[str],
+    qualifiers: Sequence[str],
 ) -> None:
     """
     @brief		Apply qualifiers to params without affecting print id.
@@ -57,10 +68,9 @@ def _apply_qualifiers(
     @param qualifiers	Qualifier tokens
     """
     for q in qualifiers:
-        if q in ["glass", "epoxy", "blue", "metallic"]:
-            params["material"] = q
-        elif q in ["fullpack", "insulated", "f"]:
-            params["tab_finish"] = "insulated"
+        action = _QUALIFIER_PARAMS.get(q)
+        if action is not None:
+            params[action[0]] = action[1]
         else:
             existing = params.get("qualifiers")
             if isinstance(existing, list):
@@ -71,39 +81,43 @@ def _apply_qualifiers(
 
 def _resolve_to_ids_and_overrides(
     raw_key: str,
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     @brief		Resolve key to canonical id, print id and overrides.
 
     @param raw_key	Raw key, qualifiers already stripped
     @return		(canonical_id, print_id, overrides)
     """
-    key = _normalise_lookup(raw_key)
-    overrides: Dict[str, Any] = {}
+    if (hit := lookup_key(raw_key)) is None:
+        return "", "", _EMPTY_OVERRIDES
+    kind, payload = hit
 
-    variant = PACKAGE_VARIANTS.get(key)
-    if variant is not None:
-        base_id = str(variant.get("base_id", ""))
-        variant_id = str(variant.get("variant_id", ""))
-        ov = variant.get("overrides", {})
-        if isinstance(ov, dict):
-            overrides = dict(ov)
-        return base_id, variant_id if variant_id else base_id, overrides
+    if kind == RESOLVE_VARIANT:
+        base_id = str(payload.get("base_id", ""))
+        variant_id = str(payload.get("variant_id", ""))
+        overrides = payload.get("overrides")
+        return (
+            base_id,
+            variant_id if variant_id else base_id,
+            dict(overrides) if overrides else _EMPTY_OVERRIDES,
+        )
 
-    alias = PACKAGE_ALIASES.get(key)
-    if alias is not None:
-        return alias, alias, overrides
+    if kind == RESOLVE_ALIAS:
+        return payload, payload, _EMPTY_OVERRIDES
 
-    if key in OUTLINES:
-        return key, key, overrides
-
-    return "", "", overrides
+    canonical_id = payload.id
+    return canonical_id, canonical_id, _EMPTY_OVERRIDES
 
 
+@lru_cache(maxsize=1024)
 def resolve_package(raw_package: str) -> Optional[resolved_package_t]:
     """
     @brief		Resolve a package string to a renderable package description.
 
+    		Results are cached per raw string and shared between callers,
+    		so params is a read-only mapping and qualifiers a tuple. Use
+    		resolve_package.cache_clear() to drop cached results.
+
     @param raw_package	Raw key from label JSON
     @return		Resolved package or None if unknown
     """
@@ -112,18 +126,26 @@ def resolve_package(raw_package: str) -> Optional[resolved_package_t]:
     if not canonical_id:
         return None
 
-    entry = OUTLINES.get(canonical_id)
-    if not isinstance(entry, dict):
+    entry = lookup_outline(canonical_id)
+    if entry is None:
         return None
 
-    family_id = entry.get("family_id")
-    base_params = entry.get("params", {})
-
-    params: Dict[str, Any] = {}
-    if isinstance(base_params, dict):
-        params.update(base_params)
-    params.update(overrides)
-    _apply_qualifiers(params, qualifiers)
+    family_id = entry.family_id
+    base_params = entry.params
+
+    if base_params is not None and not overrides and not qualifiers:
+        # Common case: share the registry params rather than copying them.
+        frozen_params: Mapping[str, Any] = MappingProxyType(base_params)
+    else:
+        params: Dict[str, Any] = {}
+        if base_params is not None:
+            params.update(base_params)
+        params.update(overrides)
+        _apply_qualifiers(params, qualifiers)
+        extra = params.get("qualifiers")
+        if isinstance(extra, list):
+            params["qualifiers"] = tuple(extra)
+        frozen_params = MappingProxyType(params)
 
     is_renderable = bool(isinstance(family_id, str) and family_id)
 
@@ -132,7 +154,7 @@ def resolve_package(raw_package: str) -> Optional[resolved_package_t]:
         canonical_id=canonical_id,
         print_id=print_id,
         family_id=family_id if isinstance(family_id, str) else None,
-        params=params,
+        params=frozen_params,
         qualifiers=qualifiers,
         is_renderable=is_renderable,
     )
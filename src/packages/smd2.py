@@ -1,11 +1,26 @@
 # file: src/packages/smd2.py
 
-from reportlab.lib.colors import black
-from reportlab.pdfgen.canvas import Canvas
+from functools import lru_cache
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import FILL_NON_ZERO, Canvas
 
 from src.core.geometry import simple_rect, scale_physical
 
 
+@lru_cache(maxsize=512)
+def _string_width(text: str, font: str, size: float) -> float:
+    """
+    @brief	Cached text width; labels repeat at the same size across a sheet.
+
+    @param text	Text to measure
+    @param font	Font name
+    @param size	Font size (pt)
+    @return	Width in points
+    """
+    return stringWidth(text, font, size)
+
+
 def draw_smd2_package(
     canvas: Canvas,
     rect: simple_rect,
@@ -34,10 +49,11 @@ def draw_smd2_package(
     cx = rect.left + rect.width * 0.5
     cy = rect.bottom + rect.height * 0.5
 
-    body_width_mm = float(info.get("body_w", 0.0))
-    body_height_mm = float(info.get("body_h", 0.0))
-    pad_width_mm = float(info.get("pad_w", 0.0))
-    pad_height_mm = float(info.get("pad_h", 0.0))
+    get = info.get
+    body_width_mm = float(get("body_w", 0.0))
+    body_height_mm = float(get("body_h", 0.0))
+    pad_width_mm = float(get("pad_w", 0.0))
+    pad_height_mm = float(get("pad_h", 0.0))
 
     if body_width_mm <= 0.0 or body_height_mm <= 0.0:
         return
@@ -51,46 +67,51 @@ def draw_smd2_package(
 
     pad_w = pad_width_mm * scale_x
     pad_h = pad_height_mm * scale_y
+    half_pad_h = pad_h * 0.5
 
     body_x = cx - body_w * 0.5
     body_y = cy - body_h * 0.5
 
     left_pad_x = body_x - pad_w
     right_pad_x = body_x + body_w
-    pad_y = cy - pad_h * 0.5
+    pad_y = cy - half_pad_h
 
-    canvas.setFillColorRGB(0.75, 0.75, 0.75)
-    canvas.rect(left_pad_x, pad_y, pad_w, pad_h, fill=1, stroke=0)
-    canvas.rect(right_pad_x, pad_y, pad_w, pad_h, fill=1, stroke=0)
+    canvas.saveState()
+    try:
+        draw_rect = canvas.rect
+        set_fill = canvas.setFillColorRGB
 
-    canvas.setFillColorRGB(0.12, 0.12, 0.12)
-    canvas.setStrokeColorRGB(0.2, 0.2, 0.2)
-    canvas.rect(body_x, body_y, body_w, body_h, fill=1, stroke=1)
+        pads = canvas.beginPath()
+        pads.rect(left_pad_x, pad_y, pad_w, pad_h)
+        pads.rect(right_pad_x, pad_y, pad_w, pad_h)
+        set_fill(0.75, 0.75, 0.75)
+        canvas.drawPath(pads, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
 
-    stripe_w = body_w * 0.15
-    canvas.setFillColorRGB(0.60, 0.60, 0.60)
-    canvas.rect(body_x + body_w - stripe_w, body_y, stripe_w, body_h, fill=1, stroke=0)
+        set_fill(0.12, 0.12, 0.12)
+        canvas.setStrokeColorRGB(0.2, 0.2, 0.2)
+        draw_rect(body_x, body_y, body_w, body_h, fill=1, stroke=1)
 
-    fs = rect.height * 0.25
-    canvas.setFont("Helvetica", fs)
-    canvas.setFillColorRGB(0.0, 0.0, 0.0)
+        stripe_w = body_w * 0.15
+        set_fill(0.60, 0.60, 0.60)
+        draw_rect(right_pad_x - stripe_w, body_y, stripe_w, body_h, fill=1, stroke=0)
 
-    a_label = str(final_labels[0]).upper() if len(final_labels) > 0 else "A"
-    k_label = str(final_labels[1]).upper() if len(final_labels) > 1 else "K"
+        fs = rect.height * 0.25
+        canvas.setFont("Helvetica", fs)
+        set_fill(0.0, 0.0, 0.0)
 
-    left_pad_outer_x = left_pad_x
-    right_pad_outer_x = right_pad_x + pad_w
+        a_label = str(final_labels[0]).upper() if len(final_labels) > 0 else "A"
+        k_label = str(final_labels[1]).upper() if len(final_labels) > 1 else "K"
 
-    pad_centre_y = pad_y + (pad_h * 0.5)
-    text_y = pad_centre_y - (fs * 0.35)
+        left_pad_outer_x = left_pad_x
+        right_pad_outer_x = right_pad_x + pad_w
 
-    a_text_w = canvas.stringWidth(a_label, "Helvetica", fs)
-    k_text_w = canvas.stringWidth(k_label, "Helvetica", fs)
+        text_y = cy - (fs * 0.35)
 
-    gap = pad_w * 0.60
+        a_text_w = _string_width(a_label, "Helvetica", fs)
 
-    canvas.drawString(left_pad_outer_x - gap - a_text_w, text_y, a_label)
-    canvas.drawString(right_pad_outer_x + gap, text_y, k_label)
+        gap = pad_w * 0.60
 
-    canvas.setFillColor(black)
-    canvas.setStrokeColor(black)
+        canvas.drawString(left_pad_outer_x - gap - a_text_w, text_y, a_label)
+        canvas.drawString(right_pad_outer_x + gap, text_y, k_label)
+    finally:
+        canvas.restoreState()
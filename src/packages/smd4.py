@@ -1,10 +1,119 @@
 # file: src/packages/smd4.py
 
-from reportlab.lib.colors import black
-from reportlab.pdfgen.canvas import Canvas
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, Tuple
+
+from reportlab.pdfgen.canvas import FILL_NON_ZERO, Canvas
 
 from src.core.geometry import simple_rect, scale_physical
 
+# row_split -> (pitch multiple from centre, row) per pad in pin order; row 0 is
+# the bottom row, row 1 the top.
+_PAD_PATTERNS = {
+    "1_3": ((-1.0, 0), (0.0, 0), (1.0, 0), (0.0, 1)),
+    "2_2": ((-0.5, 0), (0.5, 0), (-0.5, 1), (0.5, 1)),
+}
+
+# Required mm dimensions, in unpack order.
+_GET_GEOMETRY_MM = itemgetter(
+    "body_w", "body_h", "padb_w", "padb_h", "padb_pitch", "padt_w", "padt_h"
+)
+
+# Drawing grid (pt) for pad, body and dot origins; keeps the emitted
+# coordinates short. Sizes are not snapped: SMD4 pads are only a pt or two
+# across, so a size grid would visibly distort them.
+_COORD_QUANT = 0.25
+
+
+def _snap(v: float) -> float:
+    """
+    @brief	Round a coordinate to the _COORD_QUANT grid.
+    @param v	Coordinate (pt)
+    @return	Snapped coordinate
+    """
+    return round(v / _COORD_QUANT) * _COORD_QUANT
+
+
+def _snap_rect(
+    x: float, y: float, w: float, h: float
+) -> Tuple[float, float, float, float]:
+    """
+    @brief	Snap a rect's origin to the grid, keeping its size.
+    @param x	Left (pt)
+    @param y	Bottom (pt)
+    @param w	Width (pt)
+    @param h	Height (pt)
+    @return	(x, y, w, h)
+    """
+    return _snap(x), _snap(y), w, h
+
+
+@lru_cache(maxsize=128)
+def _smd4_layout(
+    row_split: str,
+    body_h: float,
+    bottom_pad_w: float,
+    bottom_pad_h: float,
+    bottom_pitch: float,
+    top_pad_w: float,
+    top_pad_h: float,
+    top_pitch: float,
+) -> Tuple[Tuple[float, float, float, float, bool], ...]:
+    """
+    @brief		Pad layout in mm, relative to the body centre.
+
+    		Cached; identical parts share one layout and each draw only
+    		scales and translates it.
+
+    @param row_split	Key into _PAD_PATTERNS
+    @param body_h	Body height (mm)
+    @param bottom_pad_w	Bottom pad width (mm)
+    @param bottom_pad_h	Bottom pad height (mm)
+    @param bottom_pitch	Bottom pad pitch (mm)
+    @param top_pad_w	Top pad width (mm)
+    @param top_pad_h	Top pad height (mm)
+    @param top_pitch	Top pad pitch (mm)
+    @return		(centre x, bottom y, w, h, is_top) per pad, in pin order
+    """
+    half_body_h = body_h * 0.5
+
+    # Per row: (pitch, bottom y, pad w, pad h).
+    rows = (
+        (bottom_pitch, -(half_body_h + bottom_pad_h), bottom_pad_w, bottom_pad_h),
+        (top_pitch, half_body_h, top_pad_w, top_pad_h),
+    )
+
+    pads = []
+    for pitch_mult, row in _PAD_PATTERNS[row_split]:
+        pitch, pad_y, pad_w, pad_h = rows[row]
+        pads.append((pitch_mult * pitch, pad_y, pad_w, pad_h, row == 1))
+    return tuple(pads)
+
+
+@lru_cache(maxsize=512)
+def _smd4_labels(
+    pin_config: Optional[str],
+    default_pin_labels: Optional[Tuple[str, ...]],
+) -> Tuple[str, str, str, str]:
+    """
+    @brief			Upper-case pad labels, padded with pin numbers.
+    @param pin_config		Spec pin config, eg "G D S T"
+    @param default_pin_labels	Fallback labels
+    @return			Four labels in pin order
+    """
+    if pin_config:
+        final_labels = pin_config.replace(",", " ").split()
+    elif default_pin_labels:
+        final_labels = default_pin_labels
+    else:
+        final_labels = ()
+
+    return tuple(
+        str(final_labels[i]).upper() if i < len(final_labels) else str(i + 1)
+        for i in range(0, 4)
+    )
+
 
 def draw_smd4_package(
     canvas: Canvas,
@@ -34,35 +143,40 @@ def draw_smd4_package(
     @param spec			Optional device spec (pin_config override)
     @return			None
     """
-    final_labels = ["1", "2", "3", "4"]
-
-    if spec is not None and getattr(spec, "pin_config", None):
-        final_labels = [p.strip() for p in spec.pin_config.replace(",", " ").split()]
-    elif default_pin_labels:
-        final_labels = list(default_pin_labels)
+    labels = _smd4_labels(
+        getattr(spec, "pin_config", None) or None,
+        tuple(default_pin_labels) if default_pin_labels else None,
+    )
 
     row_split = str(info.get("row_split", "1_3")).strip().lower()
-    if row_split not in ["1_3", "2_2"]:
+    if row_split not in _PAD_PATTERNS:
         row_split = "1_3"
 
-    body_width_mm = float(info.get("body_w", 0.0))
-    body_height_mm = float(info.get("body_h", 0.0))
-
-    bottom_pad_width_mm = float(info.get("padb_w", 0.0))
-    bottom_pad_height_mm = float(info.get("padb_h", 0.0))
-    bottom_pitch_mm = float(info.get("padb_pitch", 0.0))
+    # A missing dimension can never pass the size checks below.
+    try:
+        (
+            body_width_mm,
+            body_height_mm,
+            bottom_pad_width_mm,
+            bottom_pad_height_mm,
+            bottom_pitch_mm,
+            top_pad_width_mm,
+            top_pad_height_mm,
+        ) = map(float, _GET_GEOMETRY_MM(info))
+    except KeyError:
+        return
 
-    top_pad_width_mm = float(info.get("padt_w", 0.0))
-    top_pad_height_mm = float(info.get("padt_h", 0.0))
     top_pitch_mm = float(info.get("padt_pitch", bottom_pitch_mm))
 
-    if body_width_mm <= 0.0 or body_height_mm <= 0.0:
-        return
-    if bottom_pad_width_mm <= 0.0 or bottom_pad_height_mm <= 0.0:
-        return
-    if top_pad_width_mm <= 0.0 or top_pad_height_mm <= 0.0:
-        return
-    if bottom_pitch_mm <= 0.0:
+    if (
+        body_width_mm <= 0.0
+        or body_height_mm <= 0.0
+        or bottom_pad_width_mm <= 0.0
+        or bottom_pad_height_mm <= 0.0
+        or top_pad_width_mm <= 0.0
+        or top_pad_height_mm <= 0.0
+        or bottom_pitch_mm <= 0.0
+    ):
         return
     if row_split == "2_2" and top_pitch_mm <= 0.0:
         return
@@ -75,121 +189,75 @@ def draw_smd4_package(
     scale_x = body_w / body_width_mm
     scale_y = body_h / body_height_mm
 
-    bottom_pad_w = bottom_pad_width_mm * scale_x
-    bottom_pad_h = bottom_pad_height_mm * scale_y
-    bottom_pitch = bottom_pitch_mm * scale_x
-
-    top_pad_w = top_pad_width_mm * scale_x
-    top_pad_h = top_pad_height_mm * scale_y
-    top_pitch = top_pitch_mm * scale_x
-
-    body_y = cy - body_h * 0.5
-
-    bottom_row_y = body_y - bottom_pad_h
-    top_row_y = body_y + body_h
-
-    pad_centres_x = []
-    pad_centres_y = []
-    pad_sizes = []
-
-    if row_split == "1_3":
-        bottom_centres = [
-            cx - bottom_pitch,
-            cx,
-            cx + bottom_pitch,
-        ]
-        top_centres = [cx]
-
-        pad_centres_x.extend(bottom_centres)
-        pad_centres_y.extend([bottom_row_y + (bottom_pad_h * 0.5)] * 3)
-        pad_sizes.extend([(bottom_pad_w, bottom_pad_h)] * 3)
-
-        pad_centres_x.extend(top_centres)
-        pad_centres_y.extend([top_row_y + (top_pad_h * 0.5)] * 1)
-        pad_sizes.extend([(top_pad_w, top_pad_h)] * 1)
-    else:
-        bottom_centres = [
-            cx - (bottom_pitch * 0.5),
-            cx + (bottom_pitch * 0.5),
-        ]
-        top_centres = [
-            cx - (top_pitch * 0.5),
-            cx + (top_pitch * 0.5),
-        ]
-
-        pad_centres_x.extend(bottom_centres)
-        pad_centres_y.extend([bottom_row_y + (bottom_pad_h * 0.5)] * 2)
-        pad_sizes.extend([(bottom_pad_w, bottom_pad_h)] * 2)
-
-        pad_centres_x.extend(top_centres)
-        pad_centres_y.extend([top_row_y + (top_pad_h * 0.5)] * 2)
-        pad_sizes.extend([(top_pad_w, top_pad_h)] * 2)
-
-    canvas.setFillColorRGB(0.75, 0.75, 0.75)
-    for i in range(0, 4):
-        pad_w, pad_h = pad_sizes[i]
-        pad_x = pad_centres_x[i] - (pad_w * 0.5)
-        pad_y = pad_centres_y[i] - (pad_h * 0.5)
-        canvas.rect(pad_x, pad_y, pad_w, pad_h, fill=1, stroke=0)
-
-    stroke_width = 1.0
-    body_inner_w = max(0.0, body_w - stroke_width)
-    body_inner_h = max(0.0, body_h - stroke_width)
-
-    body_inner_x = cx - (body_inner_w * 0.5)
-    body_inner_y = cy - (body_inner_h * 0.5)
-
-    canvas.setLineWidth(stroke_width)
-    canvas.setFillColorRGB(0.12, 0.12, 0.12)
-    canvas.setStrokeColorRGB(0.2, 0.2, 0.2)
-    canvas.rect(
-        body_inner_x,
-        body_inner_y,
-        body_inner_w,
-        body_inner_h,
-        fill=1,
-        stroke=1,
-    )
-
-    pin_one_dot_r = min(body_inner_w, body_inner_h) * 0.07
-    pin_one_dot_x = body_inner_x + (pin_one_dot_r * 1.8)
-    pin_one_dot_y = body_inner_y + body_inner_h - (pin_one_dot_r * 1.8)
-    canvas.setFillColorRGB(0.60, 0.60, 0.60)
-    canvas.circle(
-        pin_one_dot_x,
-        pin_one_dot_y,
-        pin_one_dot_r,
-        stroke=0,
-        fill=1,
+    layout = _smd4_layout(
+        row_split,
+        body_height_mm,
+        bottom_pad_width_mm,
+        bottom_pad_height_mm,
+        bottom_pitch_mm,
+        top_pad_width_mm,
+        top_pad_height_mm,
+        top_pitch_mm,
     )
 
-    fs = rect.height * 0.25
-    canvas.setFont("Helvetica", fs)
-    canvas.setFillColorRGB(0.0, 0.0, 0.0)
-
-    labels = []
-    for i in range(0, 4):
-        if i < len(final_labels):
-            labels.append(str(final_labels[i]).upper())
-        else:
-            labels.append(str(i + 1))
-
-    label_gap = fs * 0.75
-
-    for i in range(0, 4):
-        is_top = False
-        if row_split == "1_3":
-            is_top = i == 3
-        else:
-            is_top = i >= 2
-
-        label_y = pad_centres_y[i]
-        if is_top:
-            label_y = pad_centres_y[i] + (pad_sizes[i][1] * 0.5) + label_gap
-        else:
-            label_y = pad_centres_y[i] - (pad_sizes[i][1] * 0.5) - label_gap
-
-        canvas.drawCentredString(pad_centres_x[i], label_y, labels[i])
-
-    canvas.setFillColor(black)
-    canvas.setStrokeColor(black)
+    # (centre x, bottom y, w, h, is_top) per pad, in pin order.
+    pads = [
+        (cx + rel_x * scale_x, cy + rel_y * scale_y, w * scale_x, h * scale_y, is_top)
+        for rel_x, rel_y, w, h, is_top in layout
+    ]
+
+    canvas.saveState()
+    try:
+        set_fill = canvas.setFillColorRGB
+
+        pad_path = canvas.beginPath()
+        for pad_cx, pad_y, pad_w, pad_h, _ in pads:
+            pad_path.rect(*_snap_rect(pad_cx - (pad_w * 0.5), pad_y, pad_w, pad_h))
+        set_fill(0.75, 0.75, 0.75)
+        canvas.drawPath(pad_path, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
+
+        stroke_width = 1.0
+        body_inner_w = max(0.0, body_w - stroke_width)
+        body_inner_h = max(0.0, body_h - stroke_width)
+
+        body_inner_x = cx - (body_inner_w * 0.5)
+        body_inner_y = cy - (body_inner_h * 0.5)
+
+        canvas.setLineWidth(stroke_width)
+        set_fill(0.12, 0.12, 0.12)
+        canvas.setStrokeColorRGB(0.2, 0.2, 0.2)
+        canvas.rect(
+            *_snap_rect(body_inner_x, body_inner_y, body_inner_w, body_inner_h),
+            fill=1,
+            stroke=1,
+        )
+
+        pin_one_dot_r = min(body_inner_w, body_inner_h) * 0.07
+        pin_one_dot_inset = pin_one_dot_r * 1.8
+        pin_one_dot_x = body_inner_x + pin_one_dot_inset
+        pin_one_dot_y = body_inner_y + body_inner_h - pin_one_dot_inset
+        set_fill(0.60, 0.60, 0.60)
+        canvas.circle(
+            _snap(pin_one_dot_x),
+            _snap(pin_one_dot_y),
+            pin_one_dot_r,
+            stroke=0,
+            fill=1,
+        )
+
+        fs = rect.height * 0.25
+        canvas.setFont("Helvetica", fs)
+        set_fill(0.0, 0.0, 0.0)
+
+        label_gap = fs * 0.75
+
+        draw_centred = canvas.drawCentredString
+        for (pad_cx, pad_y, _, pad_h, is_top), label in zip(pads, labels):
+            if is_top:
+                label_y = pad_y + pad_h + label_gap
+            else:
+                label_y = pad_y - label_gap
+
+            draw_centred(pad_cx, label_y, label)
+    finally:
+        canvas.restoreState()
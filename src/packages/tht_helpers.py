@@ -1,27 +1,61 @@
 # file: src/packages/tht_helpers.py
 
-from math import atan2, cos, degrees, sin, sqrt
-from typing import List, Tuple
+from functools import lru_cache
+from math import atan2, cos, degrees, hypot, pi, radians, sin
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
 
-from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfgen.canvas import FILL_NON_ZERO, Canvas
 
 
-def parse_pin_config(pc: str) -> list[str]:
+@lru_cache(maxsize=256)
+def parse_pin_config(pc: str) -> Tuple[str, ...]:
     """
-    @brief	Split 'g d s' or 'g,d,s' etc into ['G','D','S'].
+    @brief	Split 'g d s' or 'g,d,s' etc into ('g','d','s').
+
+    		Cached; the tuple is shared between callers.
+
     @param pc	Pin config string
-    @return	List of labels
+    @return	Tuple of labels
     """
-    return [p.strip() for p in pc.replace(",", " ").split() if p.strip()]
+    return tuple(pc.replace(",", " ").split())
 
 
-def default_numeric_labels(n: int) -> list[str]:
+@lru_cache(maxsize=64)
+def default_numeric_labels(n: int) -> Tuple[str, ...]:
     """
-    @brief	Default numeric labels: ['1','2','3',...].
+    @brief	Default numeric labels: ('1','2','3',...).
+
+    		Cached; the tuple is shared between callers.
+
     @param n	Count
     @return	Labels
     """
-    return [str(i + 1) for i in range(n)]
+    return tuple(str(i + 1) for i in range(n))
+
+
+def resolve_spec_values(
+    spec: object | None,
+    defaults: Mapping[str, Any],
+) -> Dict[str, Any]:
+    """
+    @brief		Read named values from a spec in one pass, with defaults.
+
+    		Each value is converted to the type of its default, so float
+    		defaults give floats and str defaults give strings. Values are
+    		read with getattr because the registry's params proxy has no
+    		__dict__.
+
+    @param spec		Resolved package params, or None for all defaults
+    @param defaults	Name to default value
+    @return		Name to resolved value
+    """
+    if spec is None:
+        return dict(defaults)
+
+    return {
+        name: type(default)(getattr(spec, name, default))
+        for name, default in defaults.items()
+    }
 
 
 def compute_offsets(pin_count: int, pitch: float) -> list[float]:
@@ -35,7 +69,44 @@ def compute_offsets(pin_count: int, pitch: float) -> list[float]:
         return [0.0]
     if pin_count == 2:
         return [-pitch, +pitch]
-    return [(i - (pin_count - 1) / 2.0) * pitch for i in range(pin_count)]
+    mid = (pin_count - 1) / 2.0
+    return [(i - mid) * pitch for i in range(pin_count)]
+
+
+@lru_cache(maxsize=16)
+def label_adjust_signs(pin_count: int) -> Tuple[float, ...]:
+    """
+    @brief		Signs that push labels away from the middle lead.
+    @param pin_count	Number of pins
+    @return		-1.0 below the middle, +1.0 above it and 0.0 at it
+    """
+    mid = (pin_count - 1) / 2.0
+    return tuple(
+        -1.0 if i < mid else (1.0 if i > mid else 0.0) for i in range(pin_count)
+    )
+
+
+@lru_cache(maxsize=256)
+def compute_label_font_size(rect_h: float, pin_count: int) -> float:
+    """
+    @brief		Lead label font size for side-view THT packages.
+
+    		0.20 of the rect height up to 4 pins, shrinking by 0.03 per
+    		extra pin, never below 0.10.
+
+    @param rect_h	Target rect height in px
+    @param pin_count	Number of pins
+    @return		Font size in px
+    """
+    if pin_count <= 4:
+        fs = rect_h * 0.20
+    else:
+        fs = rect_h * (0.20 - 0.03 * (pin_count - 4))
+
+    min_fs = rect_h * 0.10
+    if fs < min_fs:
+        return min_fs
+    return fs
 
 
 def clamp_int(value: int, minimum: int, maximum: int) -> int:
@@ -71,93 +142,231 @@ def clamp_float(value: float, minimum: float, maximum: float) -> float:
 def linspace_angles_deg(count: int, start_deg: float, stop_deg: float) -> List[float]:
     """
     @brief		Generate evenly spaced angles in degrees, inclusive of endpoints.
+    @note		Prefer linspace_angles_rad when the angles feed cos/sin.
     @param count	Number of angles
     @param start_deg	Start angle in degrees
     @param stop_deg	Stop angle in degrees
     @return		List of angles
     """
-    result: List[float] = []
     count = clamp_int(int(count), 1, 32)
 
     if count == 1:
-        result.append((start_deg + stop_deg) * 0.5)
-        return result
+        return [(start_deg + stop_deg) * 0.5]
 
     span = stop_deg - start_deg
     step = span / float(count - 1)
 
-    i = 0
-    while i < count:
-        result.append(start_deg + step * float(i))
-        i += 1
-
-    return result
+    return [start_deg + step * i for i in range(count)]
 
 
 def ring_angles_deg(count: int, start_deg: float = -90.0) -> List[float]:
     """
     @brief		Generate uniformly spaced angles around a full 360° ring.
+    @note		Prefer ring_angles_rad when the angles feed cos/sin.
     @param count	Number of angles
     @param start_deg	Start angle in degrees
     @return		List of angles
     """
-    result: List[float] = []
     count = clamp_int(int(count), 1, 32)
 
     step = 360.0 / float(count)
 
-    i = 0
-    while i < count:
-        result.append(start_deg + (step * float(i)))
-        i += 1
+    return [start_deg + (step * i) for i in range(count)]
 
-    return result
 
+def linspace_angles_rad(count: int, start_rad: float, stop_rad: float) -> List[float]:
+    """
+    @brief		Generate evenly spaced angles in radians, inclusive of endpoints.
 
-def draw_pin_with_ring(
+    		Radian form of linspace_angles_deg, for callers feeding cos/sin.
+
+    @param count	Number of angles
+    @param start_rad	Start angle in radians
+    @param stop_rad	Stop angle in radians
+    @return		List of angles
+    """
+    count = clamp_int(int(count), 1, 32)
+
+    if count == 1:
+        return [(start_rad + stop_rad) * 0.5]
+
+    step = (stop_rad - start_rad) / float(count - 1)
+
+    return [start_rad + step * i for i in range(count)]
+
+
+def ring_angles_rad(count: int, start_rad: float = -0.5 * pi) -> List[float]:
+    """
+    @brief		Generate uniformly spaced angles around a full ring, in radians.
+
+    		Radian form of ring_angles_deg, for callers feeding cos/sin.
+
+    @param count	Number of angles
+    @param start_rad	Start angle in radians
+    @return		List of angles
+    """
+    count = clamp_int(int(count), 1, 32)
+
+    step = (2.0 * pi) / float(count)
+
+    return [start_rad + (step * i) for i in range(count)]
+
+
+@lru_cache(maxsize=128)
+def unit_vectors_deg(angles_deg: Tuple[float, ...]) -> Tuple[Tuple[float, float], ...]:
+    """
+    @brief		Return (cos, sin) unit vectors for angles in degrees.
+
+    		Cached; pin angle sets repeat for every instance of a package.
+
+    @param angles_deg	Angles in degrees
+    @return		Tuple of (ux, uy)
+    """
+    return tuple((cos(a), sin(a)) for a in map(radians, angles_deg))
+
+
+@lru_cache(maxsize=64)
+def ring_unit_vectors(
+    count: int, start_deg: float = -90.0
+) -> Tuple[Tuple[float, float], ...]:
+    """
+    @brief		Unit vectors for ring_angles_deg(count, start_deg).
+    @param count	Number of angles
+    @param start_deg	Start angle in degrees
+    @return		Tuple of (ux, uy)
+    """
+    return tuple((cos(a), sin(a)) for a in ring_angles_rad(count, radians(start_deg)))
+
+
+@lru_cache(maxsize=64)
+def arc_unit_vectors(
+    count: int, start_deg: float, stop_deg: float
+) -> Tuple[Tuple[float, float], ...]:
+    """
+    @brief		Unit vectors for count angles spread over an arc, endpoints included.
+    @param count	Number of angles
+    @param start_deg	Start angle in degrees
+    @param stop_deg	Stop angle in degrees
+    @return		Tuple of (ux, uy)
+    """
+    angles = linspace_angles_rad(count, radians(start_deg), radians(stop_deg))
+    return tuple((cos(a), sin(a)) for a in angles)
+
+
+def _pin_ring_geometry(
+    pin_r: float, ring_total_diameter_scale: float
+) -> Tuple[float, float, float]:
+    """
+    @brief				Clamp pin core and ring dimensions.
+    @param pin_r			Core radius in px
+    @param ring_total_diameter_scale	Outer ring diameter / core diameter
+    @return				(core_r, ring_stroke, ring_draw_r)
+    """
+    # Clamps are inlined; this runs once per pin batch.
+    core_r = pin_r if pin_r >= 0.1 else 0.1
+
+    scale = float(ring_total_diameter_scale)
+    scale = 1.05 if scale < 1.05 else 10.0 if scale > 10.0 else scale
+    ring_outer_r = core_r * scale
+
+    ring_stroke = ring_outer_r - core_r
+    max_stroke = core_r * 6.0
+    if ring_stroke < 0.4:
+        ring_stroke = 0.4
+    elif ring_stroke > max_stroke:
+        ring_stroke = max_stroke
+
+    ring_draw_r = ring_outer_r - (ring_stroke * 0.5)
+    min_draw_r = core_r + 0.05
+    if ring_draw_r < min_draw_r:
+        ring_draw_r = min_draw_r
+    elif ring_draw_r > ring_outer_r:
+        ring_draw_r = ring_outer_r
+
+    return core_r, ring_stroke, ring_draw_r
+
+
+def draw_pins_with_ring(
     canvas: Canvas,
     *,
-    x: float,
-    y: float,
+    centres: Sequence[Tuple[float, float]],
     pin_r: float,
     ring_total_diameter_scale: float = 3.0,
     ring_rgb: Tuple[float, float, float] = (0.1, 0.35, 0.9),
     core_rgb: Tuple[float, float, float] = (0.92, 0.92, 0.92),
 ) -> None:
     """
-    @brief				Draw a pin as a filled core circle with a stroked ring.
+    @brief				Draw pins as filled core circles with stroked rings.
+
+    					All rings go out as one stroked path, then all cores
+    					as one filled path. Every ring is therefore painted
+    					before any core, not ring then core per pin: where a
+    					ring overlaps a neighbouring pin (eg TO-204 with
+    					ring_total_diameter_scale=4.0), that pin's core is
+    					drawn over the ring.
+
     @param canvas			ReportLab canvas
-    @param x				Pin centre x
-    @param y				Pin centre y
+    @param centres			Pin centres (x, y)
     @param pin_r			Core radius in px
     @param ring_total_diameter_scale	Outer ring diameter / core diameter
     @param ring_rgb			Ring colour (r,g,b)
     @param core_rgb			Core colour (r,g,b)
     """
-    core_r = clamp_float(pin_r, 0.1, 1.0e9)
-
-    scale = clamp_float(float(ring_total_diameter_scale), 1.05, 10.0)
-    ring_outer_r = core_r * scale
-
-    ring_stroke = ring_outer_r - core_r
-    ring_stroke = clamp_float(ring_stroke, 0.4, core_r * 6.0)
+    if not centres:
+        return
 
-    ring_draw_r = ring_outer_r - (ring_stroke * 0.5)
-    ring_draw_r = clamp_float(ring_draw_r, core_r + 0.05, ring_outer_r)
+    core_r, ring_stroke, ring_draw_r = _pin_ring_geometry(
+        pin_r, ring_total_diameter_scale
+    )
 
     canvas.saveState()
 
-    canvas.setStrokeColorRGB(ring_rgb[0], ring_rgb[1], ring_rgb[2])
+    rings = canvas.beginPath()
+    for x, y in centres:
+        rings.circle(x, y, ring_draw_r)
+    canvas.setStrokeColorRGB(*ring_rgb)
     canvas.setLineWidth(ring_stroke)
-    canvas.circle(x, y, ring_draw_r, stroke=1, fill=0)
+    canvas.drawPath(rings, stroke=1, fill=0)
 
-    canvas.setFillColorRGB(core_rgb[0], core_rgb[1], core_rgb[2])
-    canvas.setLineWidth(max(core_r * 0.15, 0.6))
-    canvas.circle(x, y, core_r, stroke=0, fill=1)
+    cores = canvas.beginPath()
+    for x, y in centres:
+        cores.circle(x, y, core_r)
+    canvas.setFillColorRGB(*core_rgb)
+    canvas.drawPath(cores, stroke=0, fill=1, fillMode=FILL_NON_ZERO)
 
     canvas.restoreState()
 
 
+def draw_pin_with_ring(
+    canvas: Canvas,
+    *,
+    x: float,
+    y: float,
+    pin_r: float,
+    ring_total_diameter_scale: float = 3.0,
+    ring_rgb: Tuple[float, float, float] = (0.1, 0.35, 0.9),
+    core_rgb: Tuple[float, float, float] = (0.92, 0.92, 0.92),
+) -> None:
+    """
+    @brief				Draw a pin as a filled core circle with a stroked ring.
+    @param canvas			ReportLab canvas
+    @param x				Pin centre x
+    @param y				Pin centre y
+    @param pin_r			Core radius in px
+    @param ring_total_diameter_scale	Outer ring diameter / core diameter
+    @param ring_rgb			Ring colour (r,g,b)
+    @param core_rgb			Core colour (r,g,b)
+    """
+    draw_pins_with_ring(
+        canvas,
+        centres=((x, y),),
+        pin_r=pin_r,
+        ring_total_diameter_scale=ring_total_diameter_scale,
+        ring_rgb=ring_rgb,
+        core_rgb=core_rgb,
+    )
+
+
 def draw_radial_pin_label(
     canvas: Canvas,
     *,
@@ -182,15 +391,79 @@ def draw_radial_pin_label(
     """
     vx = pin_x - cx
     vy = pin_y - cy
-    d = sqrt((vx * vx) + (vy * vy))
+    d = hypot(vx, vy)
 
     if d <= 1.0e-6:
         return
 
-    ux = vx / d
-    uy = vy / d
+    draw_radial_pin_label_uv(
+        canvas,
+        pin_x=pin_x,
+        pin_y=pin_y,
+        ux=vx / d,
+        uy=vy / d,
+        label=label,
+        font_size=font_size,
+        pad=pad,
+    )
 
+
+def draw_radial_pin_label_uv(
+    canvas: Canvas,
+    *,
+    pin_x: float,
+    pin_y: float,
+    ux: float,
+    uy: float,
+    label: str,
+    font_size: float,
+    pad: float,
+) -> None:
+    """
+    @brief		Draw a label offset from the pin along a known unit vector.
+
+    		For callers that placed the pin from an angle and already hold
+    		its cos/sin.
+
+    @param canvas	ReportLab canvas
+    @param pin_x	Pin centre x
+    @param pin_y	Pin centre y
+    @param ux		Outward unit vector x
+    @param uy		Outward unit vector y
+    @param label	Label text
+    @param font_size	Font size in px
+    @param pad		Radial padding in px
+    """
     tx = pin_x + (ux * pad)
     ty = pin_y + (uy * pad)
 
     canvas.drawCentredString(tx, ty - (font_size * 0.35), label)
+
+
+def draw_radial_pin_labels_uv(
+    canvas: Canvas,
+    *,
+    centres: Sequence[Tuple[float, float]],
+    unit_vectors: Sequence[Tuple[float, float]],
+    labels: Iterable[str],
+    font_size: float,
+    pad: float,
+) -> None:
+    """
+    @brief		Draw a label per pin, each offset along its unit vector.
+
+    		Stops at the shortest of centres, unit_vectors and labels. Font
+    		and fill colour are taken from the current canvas state.
+
+    @param canvas	ReportLab canvas
+    @param centres	Pin centres
+    @param unit_vectors	Outward unit vectors, one per pin
+    @param labels	Label texts
+    @param font_size	Font size in px
+    @param pad		Radial padding in px
+    """
+    draw_centred = canvas.drawCentredString
+    drop = font_size * 0.35
+
+    for (px, py), (ux, uy), label in zip(centres, unit_vectors, labels):
+        draw_centred(px + (ux * pad), py + (uy * pad) - drop, label)
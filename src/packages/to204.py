@@ -3,20 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from math import acos, atan2, cos, degrees, radians, sin, sqrt, tan
-from typing import List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from reportlab.pdfgen.canvas import Canvas
 
 from src.core.geometry import simple_rect
 
 from src.packages.tht_helpers import (
+    arc_unit_vectors,
     clamp_float,
     clamp_int,
     default_numeric_labels,
-    draw_pin_with_ring,
-    draw_radial_pin_label,
-    linspace_angles_deg,
+    draw_pins_with_ring,
+    draw_radial_pin_labels_uv,
     parse_pin_config,
 )
 
@@ -70,108 +71,6 @@ class to204_dims_t:
     lead_diameter_mm: float = 1.00
 
 
-def _scale_mm_to_px(*, mm: float, ref_mm: float, ref_px: float) -> float:
-    """
-    @brief		Convert a millimetre dimension into local pixels using a reference.
-    @param mm		Dimension in mm
-    @param ref_mm	Reference mm matching ref_px
-    @param ref_px	Reference pixels
-    @return		Pixels
-    """
-    if ref_mm <= 0.0:
-        return 0.0
-    return (mm / ref_mm) * ref_px
-
-
-def _v_sub(a: Tuple[float, float], b: Tuple[float, float]) -> Tuple[float, float]:
-    """
-    @brief	Vector subtraction a - b.
-    @param a	Vector a
-    @param b	Vector b
-    @return	Result vector
-    """
-    return (a[0] - b[0], a[1] - b[1])
-
-
-def _v_add(a: Tuple[float, float], b: Tuple[float, float]) -> Tuple[float, float]:
-    """
-    @brief	Vector addition a + b.
-    @param a	Vector a
-    @param b	Vector b
-    @return	Result vector
-    """
-    return (a[0] + b[0], a[1] + b[1])
-
-
-def _v_mul(a: Tuple[float, float], s: float) -> Tuple[float, float]:
-    """
-    @brief	Scalar multiply.
-    @param a	Vector
-    @param s	Scalar
-    @return	Result vector
-    """
-    return (a[0] * s, a[1] * s)
-
-
-def _v_len(a: Tuple[float, float]) -> float:
-    """
-    @brief	Vector length.
-    @param a	Vector
-    @return	Length
-    """
-    return sqrt((a[0] * a[0]) + (a[1] * a[1]))
-
-
-def _v_unit(a: Tuple[float, float]) -> Tuple[float, float]:
-    """
-    @brief	Unit vector.
-    @param a	Vector
-    @return	Unit vector, or (0,0) if zero
-    """
-    l = _v_len(a)
-    if l <= 1.0e-9:
-        return (0.0, 0.0)
-    return (a[0] / l, a[1] / l)
-
-
-def _v_dot(a: Tuple[float, float], b: Tuple[float, float]) -> float:
-    """
-    @brief	Dot product.
-    @param a	Vector a
-    @param b	Vector b
-    @return	Dot product
-    """
-    return (a[0] * a[0]) + (a[1] * b[1])
-
-
-def _angle_deg_from_centre(
-    centre: Tuple[float, float],
-    point: Tuple[float, float],
-) -> float:
-    """
-    @brief		Angle in degrees from centre to point.
-    @param centre	Centre point
-    @param point	Point on circle
-    @return		Angle in degrees
-    """
-    return degrees(atan2(point[1] - centre[1], point[0] - centre[0]))
-
-
-def _rotate_point_about_centre_90_deg(
-    centre: Tuple[float, float],
-    point: Tuple[float, float],
-) -> Tuple[float, float]:
-    """
-    @brief		Rotate a point about centre by +90 degrees.
-    @param centre	Rotation centre
-    @param point	Point to rotate
-    @return		Rotated point
-    """
-    dx = point[0] - centre[0]
-    dy = point[1] - centre[1]
-    return (centre[0] - dy, centre[1] + dx)
-
-
 def _safe_corner_radius_for_diamond(
     *,
     tip_dx: float,
@@ -188,61 +87,65 @@ def _safe_corner_radius_for_diamond(
     if requested_r <= 0.0:
         return 0.0
 
-    top = (0.0, tip_dy)
-    right = (tip_dx, 0.0)
-    bot = (0.0, -tip_dy)
-    left = (-tip_dx, 0.0)
-    pts = [top, right, bot, left]
+    # All four diamond edges share the same length.
+    edge_len = sqrt((tip_dx * tip_dx) + (tip_dy * tip_dy))
+    max_r = min(requested_r, edge_len * 0.45)
 
-    max_r = requested_r
+    return clamp_float(max_r, 0.0, min(tip_dx, tip_dy) * 0.49)
 
-    i = 0
-    while i < 4:
-        a = pts[i]
-        b = pts[(i + 1) % 4]
-        edge_len = _v_len(_v_sub(b, a))
-        max_r = min(max_r, edge_len * 0.45)
-        i += 1
 
-    return clamp_float(max_r, 0.0, min(tip_dx, tip_dy) * 0.49)
+# Corner angles outside this range are left unfilleted.
+_PHI_MIN = radians(2.0)
+_PHI_MAX = radians(178.0)
 
 
 def _fillet_arc_for_corner(
-    prev_pt: Tuple[float, float],
-    corner_pt: Tuple[float, float],
-    next_pt: Tuple[float, float],
+    prev_x: float,
+    prev_y: float,
+    corner_x: float,
+    corner_y: float,
+    next_x: float,
+    next_y: float,
     radius: float,
-) -> Optional[
-    Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float], float, float]
-]:
+) -> Optional[Tuple[float, float, float, float, float, float, float, float]]:
     """
     @brief		Compute tangency points and arc parameters for a filleted corner.
-    @param prev_pt	Previous vertex
-    @param corner_pt	Corner vertex
-    @param next_pt	Next vertex
+    @param prev_x	Previous vertex x
+    @param prev_y	Previous vertex y
+    @param corner_x	Corner vertex x
+    @param corner_y	Corner vertex y
+    @param next_x	Next vertex x
+    @param next_y	Next vertex y
     @param radius	Requested fillet radius in px
-    @return		(t1, t2, centre, start_deg, extent_deg) or None
+    @return		(t1x, t1y, t2x, t2y, centre_x, centre_y, start_deg, extent_deg)
+    			or None
     """
     if radius <= 0.01:
         return None
 
-    v_prev = _v_sub(prev_pt, corner_pt)
-    v_next = _v_sub(next_pt, corner_pt)
-    len_prev = _v_len(v_prev)
-    len_next = _v_len(v_next)
+    vpx = prev_x - corner_x
+    vpy = prev_y - corner_y
+    vnx = next_x - corner_x
+    vny = next_y - corner_y
+    len_prev = sqrt((vpx * vpx) + (vpy * vpy))
+    len_next = sqrt((vnx * vnx) + (vny * vny))
 
     if (len_prev <= 1.0e-6) or (len_next <= 1.0e-6):
         return None
 
-    v1 = _v_unit(v_prev)
-    v2 = _v_unit(v_next)
+    inv = 1.0 / len_prev
+    v1x = vpx * inv
+    v1y = vpy * inv
+    inv = 1.0 / len_next
+    v2x = vnx * inv
+    v2y = vny * inv
 
-    dot = clamp_float(_v_dot(v1, v2), -1.0, 1.0)
+    dot = clamp_float((v1x * v2x) + (v1y * v2y), -1.0, 1.0)
     phi = acos(dot)
 
-    if phi <= radians(2.0):
+    if phi <= _PHI_MIN:
         return None
-    if phi >= radians(178.0):
+    if phi >= _PHI_MAX:
         return None
 
     tan_half = tan(phi * 0.5)
@@ -261,28 +164,43 @@ def _fillet_arc_for_corner(
         return None
 
     offset = radius / max(sin(phi * 0.5), 1.0e-6)
-    bis = _v_unit(_v_add(v1, v2))
-    centre = _v_add(corner_pt, _v_mul(bis, offset))
+    bx = v1x + v2x
+    by = v1y + v2y
+    bl = sqrt((bx * bx) + (by * by))
+    if bl <= 1.0e-9:
+        bx = 0.0
+        by = 0.0
+    else:
+        inv = 1.0 / bl
+        bx *= inv
+        by *= inv
+    centre_x = corner_x + (bx * offset)
+    centre_y = corner_y + (by * offset)
 
-    t1 = _v_add(corner_pt, _v_mul(v1, t_dist))
-    t2 = _v_add(corner_pt, _v_mul(v2, t_dist))
+    t1x = corner_x + (v1x * t_dist)
+    t1y = corner_y + (v1y * t_dist)
+    t2x = corner_x + (v2x * t_dist)
+    t2y = corner_y + (v2y * t_dist)
 
-    start_deg = _angle_deg_from_centre(centre, t1)
+    u1x = t1x - centre_x
+    u1y = t1y - centre_y
+    u2x = t2x - centre_x
+    u2y = t2y - centre_y
 
-    u1 = _v_sub(t1, centre)
-    u2 = _v_sub(t2, centre)
-    cross = (u1[0] * u2[1]) - (u1[1] * u2[0])
-    dotp = (u1[0] * u2[0]) + (u1[1] * u2[1])
+    start_deg = degrees(atan2(u1y, u1x))
+
+    cross = (u1x * u2y) - (u1y * u2x)
+    dotp = (u1x * u2x) + (u1y * u2y)
 
     extent = degrees(atan2(cross, dotp))
     if abs(extent) <= 0.1:
         return None
 
-    return (t1, t2, centre, start_deg, extent)
+    return (t1x, t1y, t2x, t2y, centre_x, centre_y, start_deg, extent)
 
 
 def _path_arc_connected(
-    path: object,
+    arc_fn: Optional[Callable[..., None]],
     *,
     x1: float,
     y1: float,
@@ -293,7 +211,7 @@ def _path_arc_connected(
 ) -> None:
     """
     @brief		Add an arc segment without breaking the current subpath.
-    @param path		Path object from canvas.beginPath()
+    @param arc_fn	Bound path.arcTo (or path.arc), resolved once per path
     @param x1		Arc bbox left
     @param y1		Arc bbox bottom
     @param x2		Arc bbox right
@@ -301,38 +219,37 @@ def _path_arc_connected(
     @param start_deg	Start angle in degrees
     @param extent_deg	Sweep in degrees (signed)
     """
-    arc_to = getattr(path, "arcTo", None)
-    if callable(arc_to):
-        arc_to(x1, y1, x2, y2, start_deg, extent_deg)
-        return
-
-    arc = getattr(path, "arc", None)
-    if callable(arc):
-        arc(x1, y1, x2, y2, start_deg, extent_deg)
+    if arc_fn is not None:
+        arc_fn(x1, y1, x2, y2, start_deg, extent_deg)
 
 
 def _arc_params_from_centre(
-    *,
-    arc_centre: Tuple[float, float],
-    entry_pt: Tuple[float, float],
-    exit_pt: Tuple[float, float],
+    centre_x: float,
+    centre_y: float,
+    entry_x: float,
+    entry_y: float,
+    exit_x: float,
+    exit_y: float,
 ) -> Tuple[float, float]:
     """
     @brief		Compute arc (start_deg, extent_deg) around a fixed centre.
-    @param arc_centre	Arc centre
-    @param entry_pt	Arc start point
-    @param exit_pt	Arc end point
+    @param centre_x	Arc centre x
+    @param centre_y	Arc centre y
+    @param entry_x	Arc start point x
+    @param entry_y	Arc start point y
+    @param exit_x	Arc end point x
+    @param exit_y	Arc end point y
     @return		(start_deg, extent_deg)
     """
-    start_deg = _angle_deg_from_centre(arc_centre, entry_pt)
-
-    u1 = _v_sub(entry_pt, arc_centre)
-    u2 = _v_sub(exit_pt, arc_centre)
+    u1x = entry_x - centre_x
+    u1y = entry_y - centre_y
+    u2x = exit_x - centre_x
+    u2y = exit_y - centre_y
 
-    cross = (u1[0] * u2[1]) - (u1[1] * u2[0])
-    dotp = (u1[0] * u2[0]) + (u1[1] * u2[1])
+    cross = (u1x * u2y) - (u1y * u2x)
+    dotp = (u1x * u2x) + (u1y * u2y)
 
-    return (start_deg, degrees(atan2(cross, dotp)))
+    return (degrees(atan2(u1y, u1x)), degrees(atan2(cross, dotp)))
 
 
 def _tangent_points_from_external_point_to_circle(
@@ -340,13 +257,14 @@ def _tangent_points_from_external_point_to_circle(
     point: Tuple[float, float],
     circle_centre: Tuple[float, float],
     circle_r: float,
-) -> Optional[Tuple[Tuple[float, float], Tuple[float, float]]]:
+) -> Tuple[bool, float, float, float, float]:
     """
     @brief			Compute the two tangency points from an external point to a circle.
     @param point		External point
     @param circle_centre	Circle centre
     @param circle_r		Circle radius
-    @return			(upper_tangent, lower_tangent) or None
+    @return			(ok, upper_x, upper_y, lower_x, lower_y); the points are
+    				zero when ok is False
     """
     px, py = point
     cx, cy = circle_centre
@@ -357,7 +275,7 @@ def _tangent_points_from_external_point_to_circle(
     d = sqrt((vx * vx) + (vy * vy))
 
     if (r <= 1.0e-6) or (d <= (r + 1.0e-6)):
-        return None
+        return (False, 0.0, 0.0, 0.0, 0.0)
 
     ux = vx / d
     uy = vy / d
@@ -375,50 +293,70 @@ def _tangent_points_from_external_point_to_circle(
     tx2 = cx + r * ((ux * ca) - (perp_x * sa))
     ty2 = cy + r * ((uy * ca) - (perp_y * sa))
 
-    p1 = (tx1, ty1)
-    p2 = (tx2, ty2)
-
-    if p1[1] >= p2[1]:
-        return (p1, p2)
+    if ty1 >= ty2:
+        return (True, tx1, ty1, tx2, ty2)
 
-    return (p2, p1)
+    return (True, tx2, ty2, tx1, ty1)
 
 
-def _build_to3_outline_path(
-    canvas: Canvas,
-    *,
+def _tangent_points_axial(
     cx: float,
     cy: float,
+    arm: float,
+    r: float,
+) -> Tuple[bool, float, float, float, float]:
+    """
+    @brief		Tangency points from a point on the circle's horizontal axis.
+
+    		Specialisation of _tangent_points_from_external_point_to_circle
+    		for an external point at (cx + arm, cy).
+
+    @param cx		Circle centre x
+    @param cy		Circle centre y
+    @param arm		Signed x offset of the external point from the centre
+    @param r		Circle radius
+    @return		(ok, upper_x, upper_y, lower_x, lower_y); the points are
+    			zero when ok is False
+    """
+    d = abs(arm)
+    if (r <= 1.0e-6) or (d <= (r + 1.0e-6)):
+        return (False, 0.0, 0.0, 0.0, 0.0)
+
+    ca = r / d
+    sa = sqrt(1.0 - (ca * ca))
+
+    tx = cx + (r * ca if arm > 0.0 else -(r * ca))
+    r_sa = r * sa
+
+    return (True, tx, cy + r_sa, tx, cy - r_sa)
+
+
+_OUTLINE_QUANT = 1.0e-3
+
+
+@lru_cache(maxsize=128)
+def _to3_outline_ops(
     tip_dx: float,
     tip_dy: float,
     variable_corner_r: float,
     centre_arc_r: float,
-) -> object:
+) -> Tuple[Tuple[Any, ...], ...]:
     """
-    @brief			Build a TO-3 style outline with tangent side segments.
-    @param canvas		ReportLab canvas
-    @param cx			Centre x
-    @param cy			Centre y
+    @brief			Compute TO-3 outline path ops relative to the body centre.
     @param tip_dx		Horizontal half extent in px
     @param tip_dy		Vertical half extent in px
     @param variable_corner_r	Side corner fillet radius in px
     @param centre_arc_r		Top/bottom arc radius in px
-    @return			ReportLab path
+    @return			Tuple of ("moveTo"|"lineTo", x, y), ("arc", x1, y1, x2,
+    				y2, start_deg, extent_deg) and ("close",) ops
     """
-    centre = (cx, cy)
-
-    top0 = (cx, cy + tip_dy)
-    right0 = (cx + tip_dx, cy)
-    bot0 = (cx, cy - tip_dy)
-    left0 = (cx - tip_dx, cy)
-
-    pts0: List[Tuple[float, float]] = [top0, right0, bot0, left0]
-
-    pts: List[Tuple[float, float]] = []
-    i = 0
-    while i < 4:
-        pts.append(_rotate_point_about_centre_90_deg(centre, pts0[i]))
-        i += 1
+    # Diamond tips (top, right, bottom, left) rotated +90 degrees about centre.
+    pts: List[Tuple[float, float]] = [
+        (-tip_dy, 0.0),
+        (0.0, tip_dx),
+        (tip_dy, 0.0),
+        (0.0, -tip_dx),
+    ]
 
     left_corner_pt = pts[0]
     right_corner_pt = pts[2]
@@ -434,114 +372,182 @@ def _build_to3_outline_path(
         max(tip_dx, tip_dy) * 3.0,
     )
 
-    left_tangents = _tangent_points_from_external_point_to_circle(
-        point=left_corner_pt,
-        circle_centre=centre,
-        circle_r=centre_arc_r,
-    )
-    right_tangents = _tangent_points_from_external_point_to_circle(
-        point=right_corner_pt,
-        circle_centre=centre,
-        circle_r=centre_arc_r,
-    )
-    if (left_tangents is None) or (right_tangents is None):
-        path = canvas.beginPath()
-        path.moveTo(left_corner_pt[0], left_corner_pt[1])
-        path.lineTo(pts[1][0], pts[1][1])
-        path.lineTo(right_corner_pt[0], right_corner_pt[1])
-        path.lineTo(pts[3][0], pts[3][1])
-        path.close()
-        return path
-
-    left_upper, left_lower = left_tangents
-    right_upper, right_lower = right_tangents
+    # Both corners lie on the horizontal axis through the centre.
+    left_ok, lux, luy, llx, lly = _tangent_points_axial(0.0, 0.0, -tip_dy, centre_arc_r)
+    right_ok, rux, ruy, rlx, rly = _tangent_points_axial(0.0, 0.0, tip_dy, centre_arc_r)
+    if not (left_ok and right_ok):
+        return (
+            ("moveTo", left_corner_pt[0], left_corner_pt[1]),
+            ("lineTo", pts[1][0], pts[1][1]),
+            ("lineTo", right_corner_pt[0], right_corner_pt[1]),
+            ("lineTo", pts[3][0], pts[3][1]),
+            ("close",),
+        )
 
     right_fillet = _fillet_arc_for_corner(
-        right_upper,
-        right_corner_pt,
-        right_lower,
+        rux,
+        ruy,
+        right_corner_pt[0],
+        right_corner_pt[1],
+        rlx,
+        rly,
         variable_corner_r,
     )
     left_fillet = _fillet_arc_for_corner(
-        left_lower,
-        left_corner_pt,
-        left_upper,
+        llx,
+        lly,
+        left_corner_pt[0],
+        left_corner_pt[1],
+        lux,
+        luy,
         variable_corner_r,
     )
 
-    path = canvas.beginPath()
-
-    path.moveTo(left_upper[0], left_upper[1])
-
-    start_deg, extent_deg = _arc_params_from_centre(
-        arc_centre=centre,
-        entry_pt=left_upper,
-        exit_pt=right_upper,
-    )
-    _path_arc_connected(
-        path,
-        x1=centre[0] - centre_arc_r,
-        y1=centre[1] - centre_arc_r,
-        x2=centre[0] + centre_arc_r,
-        y2=centre[1] + centre_arc_r,
-        start_deg=start_deg,
-        extent_deg=extent_deg,
+    ops: List[Tuple[Any, ...]] = [("moveTo", lux, luy)]
+
+    start_deg, extent_deg = _arc_params_from_centre(0.0, 0.0, lux, luy, rux, ruy)
+    ops.append(
+        (
+            "arc",
+            -centre_arc_r,
+            -centre_arc_r,
+            centre_arc_r,
+            centre_arc_r,
+            start_deg,
+            extent_deg,
+        )
     )
 
     if right_fillet is None:
-        path.lineTo(right_corner_pt[0], right_corner_pt[1])
+        ops.append(("lineTo", right_corner_pt[0], right_corner_pt[1]))
     else:
-        t1, t2, arc_centre, start_deg, extent_deg = right_fillet
-        path.lineTo(t1[0], t1[1])
-        _path_arc_connected(
-            path,
-            x1=arc_centre[0] - variable_corner_r,
-            y1=arc_centre[1] - variable_corner_r,
-            x2=arc_centre[0] + variable_corner_r,
-            y2=arc_centre[1] + variable_corner_r,
-            start_deg=start_deg,
-            extent_deg=extent_deg,
+        t1x, t1y, t2x, t2y, acx, acy, start_deg, extent_deg = right_fillet
+        ops.append(("lineTo", t1x, t1y))
+        ops.append(
+            (
+                "arc",
+                acx - variable_corner_r,
+                acy - variable_corner_r,
+                acx + variable_corner_r,
+                acy + variable_corner_r,
+                start_deg,
+                extent_deg,
+            )
+        )
+        ops.append(("lineTo", t2x, t2y))
+
+    ops.append(("lineTo", rlx, rly))
+
+    start_deg, extent_deg = _arc_params_from_centre(0.0, 0.0, rlx, rly, llx, lly)
+    ops.append(
+        (
+            "arc",
+            -centre_arc_r,
+            -centre_arc_r,
+            centre_arc_r,
+            centre_arc_r,
+            start_deg,
+            extent_deg,
         )
-        path.lineTo(t2[0], t2[1])
-
-    path.lineTo(right_lower[0], right_lower[1])
-
-    start_deg, extent_deg = _arc_params_from_centre(
-        arc_centre=centre,
-        entry_pt=right_lower,
-        exit_pt=left_lower,
-    )
-    _path_arc_connected(
-        path,
-        x1=centre[0] - centre_arc_r,
-        y1=centre[1] - centre_arc_r,
-        x2=centre[0] + centre_arc_r,
-        y2=centre[1] + centre_arc_r,
-        start_deg=start_deg,
-        extent_deg=extent_deg,
     )
 
     if left_fillet is None:
-        path.lineTo(left_corner_pt[0], left_corner_pt[1])
+        ops.append(("lineTo", left_corner_pt[0], left_corner_pt[1]))
     else:
-        t1, t2, arc_centre, start_deg, extent_deg = left_fillet
-        path.lineTo(t1[0], t1[1])
-        _path_arc_connected(
-            path,
-            x1=arc_centre[0] - variable_corner_r,
-            y1=arc_centre[1] - variable_corner_r,
-            x2=arc_centre[0] + variable_corner_r,
-            y2=arc_centre[1] + variable_corner_r,
-            start_deg=start_deg,
-            extent_deg=extent_deg,
+        t1x, t1y, t2x, t2y, acx, acy, start_deg, extent_deg = left_fillet
+        ops.append(("lineTo", t1x, t1y))
+        ops.append(
+            (
+                "arc",
+                acx - variable_corner_r,
+                acy - variable_corner_r,
+                acx + variable_corner_r,
+                acy + variable_corner_r,
+                start_deg,
+                extent_deg,
+            )
         )
-        path.lineTo(t2[0], t2[1])
+        ops.append(("lineTo", t2x, t2y))
+
+    ops.append(("lineTo", lux, luy))
+    ops.append(("close",))
+    return tuple(ops)
+
+
+def _replay_ops(
+    canvas: Canvas,
+    ops: Tuple[Tuple[Any, ...], ...],
+    cx: float,
+    cy: float,
+) -> object:
+    """
+    @brief		Replay centre-relative outline ops into a new canvas path.
+    @param canvas	ReportLab canvas
+    @param ops		Ops from _to3_outline_ops
+    @param cx		Centre x
+    @param cy		Centre y
+    @return		ReportLab path
+    """
+    path = canvas.beginPath()
+    move_to = path.moveTo
+    line_to = path.lineTo
+    arc_fn = getattr(path, "arcTo", None) or getattr(path, "arc", None)
+
+    for op in ops:
+        kind = op[0]
+        if kind == "lineTo":
+            line_to(cx + op[1], cy + op[2])
+        elif kind == "arc":
+            _path_arc_connected(
+                arc_fn,
+                x1=cx + op[1],
+                y1=cy + op[2],
+                x2=cx + op[3],
+                y2=cy + op[4],
+                start_deg=op[5],
+                extent_deg=op[6],
+            )
+        elif kind == "moveTo":
+            move_to(cx + op[1], cy + op[2])
+        else:
+            path.close()
 
-    path.lineTo(left_upper[0], left_upper[1])
-    path.close()
     return path
 
 
+def _build_to3_outline_path(
+    canvas: Canvas,
+    *,
+    cx: float,
+    cy: float,
+    tip_dx: float,
+    tip_dy: float,
+    variable_corner_r: float,
+    centre_arc_r: float,
+) -> object:
+    """
+    @brief			Build a TO-3 style outline with tangent side segments.
+    @param canvas		ReportLab canvas
+    @param cx			Centre x
+    @param cy			Centre y
+    @param tip_dx		Horizontal half extent in px
+    @param tip_dy		Vertical half extent in px
+    @param variable_corner_r	Side corner fillet radius in px
+    @param centre_arc_r		Top/bottom arc radius in px
+    @return			ReportLab path
+    @note			Geometry is cached per quantised size, so repeated
+    				draws of the same part only replay the ops.
+    """
+    q = _OUTLINE_QUANT
+    ops = _to3_outline_ops(
+        round(tip_dx / q) * q,
+        round(tip_dy / q) * q,
+        round(variable_corner_r / q) * q,
+        round(centre_arc_r / q) * q,
+    )
+    return _replay_ops(canvas, ops, cx, cy)
+
+
 def draw_to204_package(
     canvas: Canvas,
     rect: simple_rect,
@@ -580,53 +586,27 @@ def draw_to204_package(
 
     cx = rect.left + rect.width * 0.5
     cy = rect.bottom + rect.height * 0.5
-    centre = (cx, cy)
 
     ref_px = min(rect.width, rect.height) * 1.75
     ref_mm = max(final_dims.body_tip_to_tip_mm, 1.0)
 
-    tip_to_tip_px = _scale_mm_to_px(
-        mm=final_dims.body_tip_to_tip_mm,
-        ref_mm=ref_mm,
-        ref_px=ref_px,
-    )
-    flat_to_flat_px = _scale_mm_to_px(
-        mm=final_dims.body_flat_to_flat_mm,
-        ref_mm=ref_mm,
-        ref_px=ref_px,
-    )
+    # mm -> px; ref_mm is at least 1.0.
+    scale = ref_px / ref_mm
 
-    variable_corner_r_px = _scale_mm_to_px(
-        mm=final_dims.body_corner_radius_mm,
-        ref_mm=ref_mm,
-        ref_px=ref_px,
-    )
-    centre_arc_r_px = _scale_mm_to_px(
-        mm=final_dims.body_centre_arc_radius_mm,
-        ref_mm=ref_mm,
-        ref_px=ref_px,
-    )
+    tip_to_tip_px = final_dims.body_tip_to_tip_mm * scale
+    flat_to_flat_px = final_dims.body_flat_to_flat_mm * scale
+
+    variable_corner_r_px = final_dims.body_corner_radius_mm * scale
+    centre_arc_r_px = final_dims.body_centre_arc_radius_mm * scale
 
     tip_dy = tip_to_tip_px * 0.5
     tip_dx = flat_to_flat_px * 0.5
 
-    mount_hole_r = _scale_mm_to_px(
-        mm=final_dims.mount_hole_diameter_mm * 0.5,
-        ref_mm=ref_mm,
-        ref_px=ref_px,
-    )
-    mount_pitch = _scale_mm_to_px(
-        mm=final_dims.mount_hole_pitch_mm,
-        ref_mm=ref_mm,
-        ref_px=ref_px,
-    )
+    mount_hole_r = final_dims.mount_hole_diameter_mm * 0.5 * scale
+    mount_pitch = final_dims.mount_hole_pitch_mm * scale
 
     pin_diameter_mm = clamp_float(float(pin_diameter_mm), 0.6, 2.5)
-    pin_r = _scale_mm_to_px(
-        mm=pin_diameter_mm * 0.5,
-        ref_mm=ref_mm,
-        ref_px=ref_px,
-    )
+    pin_r = pin_diameter_mm * 0.5 * scale
     pin_r = clamp_float(pin_r, ref_px * 0.012, ref_px * 0.06)
 
     canvas.saveState()
@@ -646,33 +626,30 @@ def draw_to204_package(
     canvas.setLineWidth(1.0)
     canvas.drawPath(base_path, stroke=1, fill=1)
 
-    mount_top0 = (cx, cy + mount_pitch * 0.5)
-    mount_bot0 = (cx, cy - mount_pitch * 0.5)
-
-    mount_left = _rotate_point_about_centre_90_deg(centre, mount_top0)
-    mount_right = _rotate_point_about_centre_90_deg(centre, mount_bot0)
+    # Mount holes sit on the horizontal axis after the +90 degree rotation.
+    mount_half_pitch = mount_pitch * 0.5
+    mount_left = (cx - mount_half_pitch, cy)
+    mount_right = (cx + mount_half_pitch, cy)
 
     canvas.setFillColorRGB(1.0, 1.0, 1.0)
     canvas.circle(mount_left[0], mount_left[1], mount_hole_r, 0, 1)
     canvas.circle(mount_right[0], mount_right[1], mount_hole_r, 0, 1)
 
-    angles = linspace_angles_deg(pin_count, pin_arc_start_deg, pin_arc_stop_deg)
+    unit_vectors = arc_unit_vectors(
+        pin_count, float(pin_arc_start_deg), float(pin_arc_stop_deg)
+    )
 
     pin_ring_r = min(tip_dx, tip_dy) * 0.50
-    pin_points: List[Tuple[float, float]] = []
-
-    for a_deg in angles:
-        a = radians(a_deg)
-        px = cx + pin_ring_r * cos(a)
-        py = cy + pin_ring_r * sin(a)
-        pin_points.append((px, py))
-        draw_pin_with_ring(
-            canvas,
-            x=px,
-            y=py,
-            pin_r=pin_r,
-            ring_total_diameter_scale=4.0,
-        )
+    pin_points: List[Tuple[float, float]] = [
+        (cx + pin_ring_r * ux, cy + pin_ring_r * uy) for ux, uy in unit_vectors
+    ]
+
+    draw_pins_with_ring(
+        canvas,
+        centres=pin_points,
+        pin_r=pin_r,
+        ring_total_diameter_scale=4.0,
+    )
 
     font_size = rect.height * 0.20
     font_size = clamp_float(font_size, rect.height * 0.08, rect.height * 0.16)
@@ -690,26 +667,13 @@ def draw_to204_package(
 
     label_index_offset = 1 if is_body_pin else 0
 
-    i = 0
-    while i < len(pin_points):
-        label_index = i + label_index_offset
-        if label_index >= len(final_labels):
-            break
-
-        label = str(final_labels[label_index]).upper()
-        px, py = pin_points[i]
-
-        draw_radial_pin_label(
-            canvas,
-            cx=cx,
-            cy=cy,
-            pin_x=px,
-            pin_y=py,
-            label=label,
-            font_size=font_size,
-            pad=radial_pad,
-        )
-
-        i += 1
+    draw_radial_pin_labels_uv(
+        canvas,
+        centres=pin_points,
+        unit_vectors=unit_vectors,
+        labels=[str(label).upper() for label in final_labels[label_index_offset:]],
+        font_size=font_size,
+        pad=radial_pad,
+    )
 
     canvas.restoreState()
@@ -1,6 +1,9 @@
 # file: src/packages/to205.py
 
+from dataclasses import dataclass
+from functools import lru_cache
 from math import cos, radians, sin
+from typing import Sequence, Tuple
 
 from reportlab.lib.colors import black
 from reportlab.pdfgen.canvas import Canvas
@@ -10,13 +13,63 @@ from src.packages.tht_helpers import (
     clamp_float,
     clamp_int,
     default_numeric_labels,
-    draw_pin_with_ring,
-    draw_radial_pin_label,
+    draw_pins_with_ring,
+    draw_radial_pin_labels_uv,
     parse_pin_config,
-    ring_angles_deg,
+    ring_unit_vectors,
+    unit_vectors_deg,
 )
 
 
+@dataclass(frozen=True)
+class to205_params_t:
+    """
+    @brief	Spec values for one TO-205 draw, read once.
+    @note	Dimensions are in millimetres
+    """
+
+    labels: Sequence[str]
+    body_d_mm: float
+    tab_w_mm: float
+    tab_h_mm: float
+    pin_diameter_mm: float
+    pin_ring_scale: float
+    pin_ring_radius_mm: float
+    body_pin_index: int
+
+
+def _resolve_to205_params(spec: object | None, pin_count: int) -> to205_params_t:
+    """
+    @brief		Read labels and dimensions from the spec, with TO-205 defaults.
+    @param spec		Resolved package params and optional pin metadata
+    @param pin_count	Pin count (3..8), already clamped
+    @return		Resolved params
+    """
+    pin_config = getattr(spec, "pin_config", None)
+    pin_labels = getattr(spec, "pin_labels", None)
+    if pin_config:
+        labels = parse_pin_config(pin_config)
+    elif pin_labels:
+        labels = pin_labels
+    else:
+        labels = default_numeric_labels(pin_count)
+
+    body_pin_index = getattr(spec, "pin_connected_to_body", None)
+    if body_pin_index is None:
+        body_pin_index = pin_count
+
+    return to205_params_t(
+        labels=labels,
+        body_d_mm=float(getattr(spec, "body_d_mm", 9.4)),
+        tab_w_mm=float(getattr(spec, "tab_w_mm", 1.8)),
+        tab_h_mm=float(getattr(spec, "tab_h_mm", 1)),
+        pin_diameter_mm=float(getattr(spec, "pin_diameter_mm", 0.74)),
+        pin_ring_scale=float(getattr(spec, "pin_ring_scale", 2.0)),
+        pin_ring_radius_mm=float(getattr(spec, "pin_ring_radius_mm", 2.54)),
+        body_pin_index=clamp_int(int(body_pin_index), 1, pin_count),
+    )
+
+
 def _draw_tab_under_body_show_outside(
     canvas: Canvas,
     *,
@@ -45,36 +98,39 @@ def _draw_tab_under_body_show_outside(
     tab_cx = cx - (body_r * 0.70)
     tab_cy = cy - (body_r * 0.70)
 
-    canvas.saveState()
-
-    canvas.translate(tab_cx, tab_cy)
-    canvas.rotate(angle_deg)
+    # Rotated half-extent vectors along the tab width and height.
+    rad = radians(angle_deg)
+    c = cos(rad)
+    s = sin(rad)
+    wx = c * tab_w * 0.5
+    wy = s * tab_w * 0.5
+    hx = -s * tab_h * 0.5
+    hy = c * tab_h * 0.5
+
+    path = canvas.beginPath()
+    path.moveTo(tab_cx - wx - hx, tab_cy - wy - hy)
+    path.lineTo(tab_cx + wx - hx, tab_cy + wy - hy)
+    path.lineTo(tab_cx + wx + hx, tab_cy + wy + hy)
+    path.lineTo(tab_cx - wx + hx, tab_cy - wy + hy)
+    path.close()
 
     canvas.setFillColorRGB(fill_rgb[0], fill_rgb[1], fill_rgb[2])
-    canvas.rect(
-        -tab_w * 0.5,
-        -tab_h * 0.5,
-        tab_w,
-        tab_h,
-        stroke=0,
-        fill=1,
-    )
-
-    canvas.restoreState()
+    canvas.drawPath(path, stroke=0, fill=1)
 
 
-def _to205_pin_angles_deg(*, pin_count: int) -> list[float]:
+@lru_cache(maxsize=8)
+def _to205_pin_unit_vectors(*, pin_count: int) -> Tuple[Tuple[float, float], ...]:
     """
-    @brief		Return pin angles in degrees for TO-205.
+    @brief		Return outward pin unit vectors for TO-205.
     @note		3-pin is placed as if it were a 4-pin with the bottom missing:
                         pin 1 left, pin 2 top, pin 3 right.
     @param pin_count	Pin count (3..8)
-    @return		List of angles in degrees
+    @return		Tuple of (ux, uy), cached per pin count
     """
     if pin_count == 3:
-        return [180.0, 90.0, 0.0]
+        return unit_vectors_deg((180.0, 90.0, 0.0))
 
-    return ring_angles_deg(pin_count, start_deg=-90.0)
+    return ring_unit_vectors(pin_count, start_deg=-90.0)
 
 
 def draw_to205_package(
@@ -93,26 +149,11 @@ def draw_to205_package(
     """
     pin_count = clamp_int(int(pin_count), 3, 8)
 
-    if spec is not None and getattr(spec, "pin_config", None):
-        final_labels = parse_pin_config(getattr(spec, "pin_config"))
-    elif spec is not None and getattr(spec, "pin_labels", None):
-        final_labels = getattr(spec, "pin_labels")
-    else:
-        final_labels = default_numeric_labels(pin_count)
-
-    body_d_mm = float(getattr(spec, "body_d_mm", 9.4))
-    tab_h_mm = float(getattr(spec, "tab_h_mm", 1))
-    tab_w_mm = float(getattr(spec, "tab_w_mm", 1.8))
-
-    pin_diameter_mm = float(getattr(spec, "pin_diameter_mm", 0.74))
-    pin_ring_scale = float(getattr(spec, "pin_ring_scale", 2.0))
+    params = _resolve_to205_params(spec, pin_count)
 
-    pin_ring_radius_mm = float(getattr(spec, "pin_ring_radius_mm", 2.54))
-
-    body_pin_index = getattr(spec, "pin_connected_to_body", None)
-    if body_pin_index is None:
-        body_pin_index = pin_count
-    body_pin_index = clamp_int(int(body_pin_index), 1, pin_count)
+    final_labels = params.labels
+    body_d_mm = params.body_d_mm
+    body_pin_index = params.body_pin_index
 
     phys_w = body_d_mm
     phys_h = body_d_mm
@@ -123,8 +164,11 @@ def draw_to205_package(
 
     body_r = min(draw_w, draw_h) * 0.5
 
-    tab_w = (tab_w_mm / body_d_mm) * (body_r * 2.0)
-    tab_h = (tab_h_mm / body_d_mm) * (body_r * 2.0)
+    # mm -> px, with the body diameter as reference.
+    scale = (body_r * 2.0) / body_d_mm
+
+    tab_w = params.tab_w_mm * scale
+    tab_h = params.tab_h_mm * scale
 
     body_fill_rgb = (0.78, 0.77, 0.76)
     body_stroke_rgb = (0.68, 0.67, 0.66)
@@ -145,13 +189,33 @@ def draw_to205_package(
     canvas.setLineWidth(1.0)
     canvas.circle(cx, cy, body_r, stroke=1, fill=1)
 
-    pin_r = (pin_diameter_mm / body_d_mm) * (body_r * 2.0) * 0.5
+    pin_r = params.pin_diameter_mm * scale * 0.5
     pin_r = clamp_float(pin_r, body_r * 0.035, body_r * 0.11)
 
-    pin_ring_r = (pin_ring_radius_mm / body_d_mm) * (body_r * 2.0)
+    pin_ring_r = params.pin_ring_radius_mm * scale
     pin_ring_r = clamp_float(pin_ring_r, body_r * 0.35, body_r * 0.70)
 
-    angles = _to205_pin_angles_deg(pin_count=pin_count)
+    unit_vectors = _to205_pin_unit_vectors(pin_count=pin_count)
+
+    pin_points = [
+        (cx + pin_ring_r * ux, cy + pin_ring_r * uy) for ux, uy in unit_vectors
+    ]
+
+    body_pin_i = body_pin_index - 1
+    draw_pins_with_ring(
+        canvas,
+        centres=[pt for i, pt in enumerate(pin_points) if i != body_pin_i],
+        pin_r=pin_r,
+        ring_total_diameter_scale=params.pin_ring_scale,
+        ring_rgb=(0.28, 0.24, 0.21),
+    )
+    draw_pins_with_ring(
+        canvas,
+        centres=(pin_points[body_pin_i],),
+        pin_r=pin_r,
+        ring_total_diameter_scale=params.pin_ring_scale,
+        ring_rgb=(0.55, 0.54, 0.53),
+    )
 
     font_size = rect.height * 0.20
     font_size = clamp_float(font_size, rect.height * 0.08, rect.height * 0.16)
@@ -161,41 +225,14 @@ def draw_to205_package(
 
     radial_pad = max(pin_r * 4.0, font_size * 1.1)
 
-    i = 0
-    while i < pin_count:
-        a = radians(angles[i])
-        px = cx + pin_ring_r * cos(a)
-        py = cy + pin_ring_r * sin(a)
-
-        pin_index_1based = i + 1
-        if pin_index_1based == body_pin_index:
-            ring_rgb = (0.55, 0.54, 0.53)
-        else:
-            ring_rgb = (0.28, 0.24, 0.21)
-
-        draw_pin_with_ring(
-            canvas,
-            x=px,
-            y=py,
-            pin_r=pin_r,
-            ring_total_diameter_scale=pin_ring_scale,
-            ring_rgb=ring_rgb,
-        )
-
-        if i < len(final_labels):
-            label = str(final_labels[i]).upper()
-            draw_radial_pin_label(
-                canvas,
-                cx=cx,
-                cy=cy,
-                pin_x=px,
-                pin_y=py,
-                label=label,
-                font_size=font_size,
-                pad=radial_pad,
-            )
-
-        i += 1
+    draw_radial_pin_labels_uv(
+        canvas,
+        centres=pin_points,
+        unit_vectors=unit_vectors,
+        labels=[str(label).upper() for label in final_labels],
+        font_size=font_size,
+        pad=radial_pad,
+    )
 
     canvas.setFillColor(black)
     canvas.setStrokeColor(black)
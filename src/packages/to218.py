@@ -1,16 +1,60 @@
 # file: src/packages/to218.py
 
-from reportlab.lib.colors import black
-from reportlab.pdfgen.canvas import Canvas
+from functools import lru_cache
+from typing import Tuple
 
+from reportlab.pdfgen.canvas import FILL_NON_ZERO, Canvas
+
+from src.core.drawing_utils import canvas_state_t
 from src.core.geometry import simple_rect, scale_physical
 from src.packages.tht_helpers import (
     parse_pin_config,
     default_numeric_labels,
+    compute_label_font_size,
     compute_offsets,
+    label_adjust_signs,
+    resolve_spec_values,
 )
 
 
+# Spec names read per draw, with their defaults.
+_SPEC_DEFAULTS = {
+    "tab_mm": 8.0,
+    "body_mm": 12.5,
+    "lead_mm": 11.9,
+    "width_mm": 15.0,
+    "hole_d": 4.0,
+    "tab_finish": "metallic",
+    "scallop_d_mm": 4.5,
+    "scallop_x_mm": 8.0,
+    "pin_pitch_3_mm": 5.75,
+    "pin_pitch_5_mm": 3.0,
+}
+
+
+@lru_cache(maxsize=64)
+def _tab_chamfer_points(
+    w: float,
+    h: float,
+    c: float,
+) -> Tuple[Tuple[float, float], ...]:
+    """
+    @brief	Compute the chamfered tab outline relative to its bottom-left corner.
+    @param w	Tab width
+    @param h	Tab height
+    @param c	Clamped chamfer size
+    @return	Outline points, starting at the bottom chamfer end
+    """
+    return (
+        (c, 0.0),
+        (w, 0.0),
+        (w, h),
+        (c, h),
+        (0.0, h - c),
+        (0.0, c),
+    )
+
+
 def _draw_tab_with_side_chamfers(
     canvas: Canvas,
     *,
@@ -33,31 +77,23 @@ def _draw_tab_with_side_chamfers(
     @param fill		ReportLab fill flag
     @param stroke	ReportLab stroke flag
     """
-    c = chamfer
-    if c < 0.0:
-        c = 0.0
-    if c > w * 0.45:
-        c = w * 0.45
-    if c > h * 0.45:
-        c = h * 0.45
+    c = max(0.0, min(chamfer, w * 0.45, h * 0.45))
+    points = _tab_chamfer_points(round(w, 3), round(h, 3), round(c, 3))
 
     path = canvas.beginPath()
-    path.moveTo(x + c, y)
-    path.lineTo(x + w, y)
-    path.lineTo(x + w, y + h)
-    path.lineTo(x + c, y + h)
-    path.lineTo(x, y + h - c)
-    path.lineTo(x, y + c)
+    first_x, first_y = points[0]
+    path.moveTo(x + first_x, y + first_y)
+    for px, py in points[1:]:
+        path.lineTo(x + px, y + py)
     path.close()
 
     canvas.drawPath(path, fill=fill, stroke=stroke)
 
 
-def _draw_internal_semicircle(
+def _draw_internal_semicircles(
     canvas: Canvas,
     *,
     cx: float,
-    edge_y: float,
     r: float,
     body_x: float,
     body_w: float,
@@ -65,38 +101,43 @@ def _draw_internal_semicircle(
     body_h: float,
 ) -> None:
     """
-    @brief		Draw a circular scallop clipped so only the portion inside the body
-                        is filled, creating an internal semicircle.
+    @brief		Draw circular scallops on the top and bottom body edges, cut
+                        off where they leave the body.
+    @note		A scallop that fits inside the body is drawn as a half-disc
+                        path; otherwise the circles clip a body-sized rect.
     @param canvas	ReportLab canvas
     @param cx		Scallop centre X
-    @param edge_y	Body edge Y the scallop is anchored to
     @param r		Scallop radius
     @param body_x	Body left X
     @param body_w	Body width
     @param body_y	Body bottom Y
     @param body_h	Body height
     """
-    canvas.saveState()
+    if r <= 0.0:
+        return
 
-    circle_path = canvas.beginPath()
-    circle_path.circle(cx, edge_y, r)
-    canvas.clipPath(circle_path, stroke=0, fill=0)
+    top_y = body_y + body_h
 
-    if edge_y > body_y + (body_h * 0.5):
-        clip_y = edge_y - r
-    else:
-        clip_y = edge_y
+    if r > min(body_h * 0.5, cx - body_x, body_x + body_w - cx):
+        canvas.saveState()
 
-    canvas.rect(
-        body_x,
-        clip_y,
-        body_w,
-        r,
-        fill=1,
-        stroke=0,
-    )
+        circles = canvas.beginPath()
+        circles.circle(cx, top_y, r)
+        circles.circle(cx, body_y, r)
+        canvas.clipPath(circles, stroke=0, fill=0, fillMode=FILL_NON_ZERO)
+
+        canvas.rect(body_x, body_y, body_w, body_h, fill=1, stroke=0)
 
-    canvas.restoreState()
+        canvas.restoreState()
+        return
+
+    path = canvas.beginPath()
+    path.arc(cx - r, top_y - r, cx + r, top_y + r, startAng=180, extent=180)
+    path.close()
+    path.arc(cx - r, body_y - r, cx + r, body_y + r, startAng=0, extent=180)
+    path.close()
+
+    canvas.drawPath(path, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
 
 
 def draw_to218_package(
@@ -122,17 +163,20 @@ def draw_to218_package(
         final_labels = getattr(spec, "pin_labels")
     else:
         final_labels = default_numeric_labels(pin_count)
+    final_labels = [str(label).upper() for label in final_labels]
+
+    values = resolve_spec_values(spec, _SPEC_DEFAULTS)
 
-    tab_mm = float(getattr(spec, "tab_mm", 8.0))
-    body_mm = float(getattr(spec, "body_mm", 12.5))
-    lead_mm = float(getattr(spec, "lead_mm", 11.9))
-    width_mm = float(getattr(spec, "width_mm", 15.0))
-    hole_d = float(getattr(spec, "hole_d", 4.0))
+    tab_mm = values["tab_mm"]
+    body_mm = values["body_mm"]
+    lead_mm = values["lead_mm"]
+    width_mm = values["width_mm"]
+    hole_d = values["hole_d"]
 
-    tab_finish = str(getattr(spec, "tab_finish", "metallic")).lower()
+    tab_finish = values["tab_finish"].lower()
 
-    scallop_d_mm = float(getattr(spec, "scallop_d_mm", 4.5))
-    scallop_x_mm = float(getattr(spec, "scallop_x_mm", 8.0))
+    scallop_d_mm = values["scallop_d_mm"]
+    scallop_x_mm = values["scallop_x_mm"]
 
     total_mm = tab_mm + body_mm + lead_mm
     phys_w = total_mm
@@ -157,10 +201,12 @@ def draw_to218_package(
 
     chamfer = draw_h * 0.12
 
+    state = canvas_state_t(canvas)
+
     if tab_finish == "insulated":
-        canvas.setFillColorRGB(0.12, 0.12, 0.12)
+        state.set_fill((0.12, 0.12, 0.12))
     else:
-        canvas.setFillColorRGB(0.82, 0.82, 0.82)
+        state.set_fill((0.82, 0.82, 0.82))
 
     _draw_tab_with_side_chamfers(
         canvas,
@@ -174,10 +220,10 @@ def draw_to218_package(
     )
 
     hole_r = (hole_d / width_mm) * draw_h * 0.5
-    canvas.setFillColorRGB(1.0, 1.0, 1.0)
+    state.set_fill((1.0, 1.0, 1.0))
     canvas.circle(tab_x + tab_w * 0.5, cy, hole_r, fill=1, stroke=0)
 
-    canvas.setFillColorRGB(0.12, 0.12, 0.12)
+    state.set_fill((0.12, 0.12, 0.12))
     canvas.rect(body_x, y0, body_w, draw_h, fill=1, stroke=0)
 
     scallop_r = (scallop_d_mm / width_mm) * draw_h * 0.5
@@ -187,23 +233,18 @@ def draw_to218_package(
     if scallop_dx > body_w * 0.90:
         scallop_dx = body_w * 0.90
 
-    top_edge_y = y0 + draw_h
-    bot_edge_y = y0
-
-    canvas.setFillColorRGB(0.25, 0.25, 0.25)
-    for edge_y in (top_edge_y, bot_edge_y):
-        _draw_internal_semicircle(
-            canvas,
-            cx=body_x + scallop_dx,
-            edge_y=edge_y,
-            r=scallop_r,
-            body_x=body_x,
-            body_w=body_w,
-            body_y=y0,
-            body_h=draw_h,
-        )
+    state.set_fill((0.25, 0.25, 0.25))
+    _draw_internal_semicircles(
+        canvas,
+        cx=body_x + scallop_dx,
+        r=scallop_r,
+        body_x=body_x,
+        body_w=body_w,
+        body_y=y0,
+        body_h=draw_h,
+    )
 
-    canvas.setFillColorRGB(0.75, 0.75, 0.75)
+    state.set_fill((0.75, 0.75, 0.75))
 
     lead_th = draw_h * 0.07
 
@@ -215,9 +256,9 @@ def draw_to218_package(
     lead_step_th = lead_th * lead_step_width_scale
 
     if pin_count == 3:
-        pitch_mm = float(getattr(spec, "pin_pitch_3_mm", 5.75))
+        pitch_mm = values["pin_pitch_3_mm"]
     else:
-        pitch_mm = float(getattr(spec, "pin_pitch_5_mm", 3.0))
+        pitch_mm = values["pin_pitch_5_mm"]
 
     pitch = (pitch_mm / width_mm) * draw_h
     if pitch <= 0.0:
@@ -229,57 +270,30 @@ def draw_to218_package(
 
     offsets = compute_offsets(pin_count, pitch)
 
+    half_lead_th = lead_th * 0.5
+    half_step_th = lead_step_th * 0.5
+    tail_x = first_pin_x + lead_step_len
+    tail_len = max(0.0, lead_w - lead_step_len)
+
+    leads = canvas.beginPath()
     for off in offsets:
-        regular_y = cy + off - lead_th * 0.5
-        step_y = cy + off - lead_step_th * 0.5
-
-        canvas.rect(
-            first_pin_x,
-            step_y,
-            lead_step_len,
-            lead_step_th,
-            fill=1,
-            stroke=0,
-        )
+        pin_y = cy + off
+        regular_y = pin_y - half_lead_th
+        step_y = pin_y - half_step_th
 
-        remaining_len = lead_w - lead_step_len
-        if remaining_len < 0.0:
-            remaining_len = 0.0
-
-        canvas.rect(
-            first_pin_x + lead_step_len,
-            regular_y,
-            remaining_len,
-            lead_th,
-            fill=1,
-            stroke=0,
-        )
+        leads.rect(first_pin_x, step_y, lead_step_len, lead_step_th)
 
-    if pin_count <= 4:
-        fs = rect.height * 0.20
-    else:
-        fs = rect.height * (0.20 - 0.03 * (pin_count - 4))
+        leads.rect(tail_x, regular_y, tail_len, lead_th)
+
+    canvas.drawPath(leads, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
 
-    min_font_fraction = 0.10
-    if fs < rect.height * min_font_fraction:
-        fs = rect.height * min_font_fraction
+    fs = compute_label_font_size(rect.height, pin_count)
 
-    canvas.setFont("Helvetica", fs)
-    canvas.setFillColorRGB(0.0, 0.0, 0.0)
+    state.set_font("Helvetica", fs)
+    state.set_fill((0.0, 0.0, 0.0))
 
     label_pad = fs * 0.35
-    label_mid = (pin_count - 1) / 2.0
-
-    label_y_adjust: list[float] = []
-    for i in range(pin_count):
-        rel = i - label_mid
-        if rel < 0.0:
-            adj = -label_pad
-        elif rel > 0.0:
-            adj = +label_pad
-        else:
-            adj = 0.0
-        label_y_adjust.append(adj)
+    label_y_adjust = [sign * label_pad for sign in label_adjust_signs(pin_count)]
 
     label_gap_fraction = 0.15
     label_x = first_pin_x + lead_w + (draw_h * label_gap_fraction)
@@ -288,7 +302,7 @@ def draw_to218_package(
         if i >= len(final_labels):
             break
 
-        label = str(final_labels[i]).upper()
+        label = final_labels[i]
         py = cy + off + label_y_adjust[i]
 
         canvas.drawString(
@@ -297,5 +311,5 @@ def draw_to218_package(
             label,
         )
 
-    canvas.setFillColor(black)
-    canvas.setStrokeColor(black)
+    state.set_fill((0.0, 0.0, 0.0))
+    state.set_stroke((0.0, 0.0, 0.0))
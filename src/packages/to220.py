@@ -1,16 +1,29 @@
 # file: src/packages/to220.py
 
-from reportlab.lib.colors import black
-from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfgen.canvas import FILL_NON_ZERO, Canvas
 
+from src.core.drawing_utils import canvas_state_t
 from src.core.geometry import simple_rect, scale_physical
 from src.packages.tht_helpers import (
     parse_pin_config,
     default_numeric_labels,
+    compute_label_font_size,
     compute_offsets,
+    label_adjust_signs,
+    resolve_spec_values,
 )
 
 
+# Spec names read per draw, with their defaults.
+_SPEC_DEFAULTS = {
+    "tab_mm": 6.5,
+    "body_mm": 9.5,
+    "lead_mm": 11.0,
+    "width_mm": 10.0,
+    "tab_finish": "metallic",
+}
+
+
 def draw_to220_package(
     canvas: Canvas,
     rect: simple_rect,
@@ -24,13 +37,16 @@ def draw_to220_package(
         final_labels = getattr(spec, "pin_labels")
     else:
         final_labels = default_numeric_labels(pin_count)
+    final_labels = [str(label).upper() for label in final_labels]
 
-    tab_mm = float(getattr(spec, "tab_mm", 6.5))
-    body_mm = float(getattr(spec, "body_mm", 9.5))
-    lead_mm = float(getattr(spec, "lead_mm", 11.0))
-    width_mm = float(getattr(spec, "width_mm", 10.0))
+    values = resolve_spec_values(spec, _SPEC_DEFAULTS)
 
-    tab_finish = str(getattr(spec, "tab_finish", "metallic")).lower()
+    tab_mm = values["tab_mm"]
+    body_mm = values["body_mm"]
+    lead_mm = values["lead_mm"]
+    width_mm = values["width_mm"]
+
+    tab_finish = values["tab_finish"].lower()
 
     total_mm = tab_mm + body_mm + lead_mm
     phys_w = total_mm
@@ -49,22 +65,24 @@ def draw_to220_package(
     body_w = draw_w * (body_mm / total_mm)
     lead_w = draw_w * (lead_mm / total_mm)
 
+    state = canvas_state_t(canvas)
+
     tab_x = x0
     if tab_finish == "insulated":
-        canvas.setFillColorRGB(0.12, 0.12, 0.12)
+        state.set_fill((0.12, 0.12, 0.12))
     else:
-        canvas.setFillColorRGB(0.82, 0.82, 0.82)
+        state.set_fill((0.82, 0.82, 0.82))
     canvas.rect(tab_x, y0, tab_w, draw_h, fill=1, stroke=0)
 
     hole_r = draw_h * 0.22
-    canvas.setFillColorRGB(1.0, 1.0, 1.0)
+    state.set_fill((1.0, 1.0, 1.0))
     canvas.circle(tab_x + tab_w * 0.5, cy, hole_r, fill=1, stroke=0)
 
     body_x = tab_x + tab_w
-    canvas.setFillColorRGB(0.12, 0.12, 0.12)
+    state.set_fill((0.12, 0.12, 0.12))
     canvas.rect(body_x, y0, body_w, draw_h, fill=1, stroke=0)
 
-    canvas.setFillColorRGB(0.75, 0.75, 0.75)
+    state.set_fill((0.75, 0.75, 0.75))
 
     pitch = draw_h * 0.30
     lead_th = draw_h * 0.08
@@ -86,61 +104,34 @@ def draw_to220_package(
     offsets = compute_offsets(draw_pin_count, pitch)
     first_pin_x = body_x + body_w
 
+    half_lead_th = lead_th * 0.5
+    half_step_th = lead_step_th * 0.5
+    tail_x = first_pin_x + lead_step_len
+    tail_len = max(0.0, lead_w - lead_step_len)
+
+    leads = canvas.beginPath()
     for i, off in enumerate(offsets):
-        regular_y = cy + off - lead_th * 0.5
-        step_y = cy + off - lead_step_th * 0.5
+        pin_y = cy + off
+        regular_y = pin_y - half_lead_th
+        step_y = pin_y - half_step_th
 
         is_stub_pin = (pin_count == 2) and (i == 1)
         draw_tail = not is_stub_pin
 
-        canvas.rect(
-            first_pin_x,
-            step_y,
-            lead_step_len,
-            lead_step_th,
-            fill=1,
-            stroke=0,
-        )
+        leads.rect(first_pin_x, step_y, lead_step_len, lead_step_th)
 
         if draw_tail:
-            remaining_len = lead_w - lead_step_len
-            if remaining_len < 0.0:
-                remaining_len = 0.0
-
-            canvas.rect(
-                first_pin_x + lead_step_len,
-                regular_y,
-                remaining_len,
-                lead_th,
-                fill=1,
-                stroke=0,
-            )
-
-    if pin_count <= 4:
-        fs = rect.height * 0.20
-    else:
-        fs = rect.height * (0.20 - 0.03 * (pin_count - 4))
+            leads.rect(tail_x, regular_y, tail_len, lead_th)
+
+    canvas.drawPath(leads, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
 
-    min_font_fraction = 0.10
-    if fs < rect.height * min_font_fraction:
-        fs = rect.height * min_font_fraction
+    fs = compute_label_font_size(rect.height, pin_count)
 
-    canvas.setFont("Helvetica", fs)
-    canvas.setFillColorRGB(0.0, 0.0, 0.0)
+    state.set_font("Helvetica", fs)
+    state.set_fill((0.0, 0.0, 0.0))
 
     label_pad = fs * 0.35
-    label_mid = (draw_pin_count - 1) / 2.0
-
-    label_y_adjust: list[float] = []
-    for i in range(draw_pin_count):
-        rel = i - label_mid
-        if rel < 0.0:
-            adj = -label_pad
-        elif rel > 0.0:
-            adj = +label_pad
-        else:
-            adj = 0.0
-        label_y_adjust.append(adj)
+    label_y_adjust = [sign * label_pad for sign in label_adjust_signs(draw_pin_count)]
 
     label_gap_fraction = 0.15
     label_x = first_pin_x + lead_w + (draw_h * label_gap_fraction)
@@ -154,7 +145,7 @@ def draw_to220_package(
         if i >= len(final_labels):
             break
 
-        label = str(final_labels[i]).upper()
+        label = final_labels[i]
         off = offsets[idx]
         adj = label_y_adjust[idx]
 
@@ -166,5 +157,5 @@ def draw_to220_package(
             label,
         )
 
-    canvas.setFillColor(black)
-    canvas.setStrokeColor(black)
+    state.set_fill((0.0, 0.0, 0.0))
+    state.set_stroke((0.0, 0.0, 0.0))
@@ -2,16 +2,30 @@
 
 from math import cos, sin, radians
 
-from reportlab.lib.colors import black
-from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfgen.canvas import FILL_NON_ZERO, Canvas
 
+from src.core.drawing_utils import canvas_state_t
 from src.core.geometry import simple_rect, scale_physical
 from src.packages.tht_helpers import (
     parse_pin_config,
     default_numeric_labels,
+    resolve_spec_values,
 )
 
 
+# Unit vectors to the reinforcement bosses around the mounting hole.
+_BOSS_DIRS = tuple((cos(radians(a)), sin(radians(a))) for a in (0, 120, 240))
+
+# Spec names read per draw, with their defaults.
+_SPEC_DEFAULTS = {
+    "body_w": 8.0,
+    "body_h": 11.0,
+    "lead_len": 16.0,
+    "lead_pitch": 2.54,
+    "hole_d": 3.20,
+}
+
+
 def draw_to225_package(
     canvas: Canvas,
     rect: simple_rect,
@@ -28,15 +42,18 @@ def draw_to225_package(
         final_labels = parse_pin_config(spec.pin_config)
     else:
         final_labels = default_numeric_labels(pin_count)
+    final_labels = [str(label).upper() for label in final_labels]
 
     # --------------------------------------------------------
     # Dimensions from DB / spec
     # --------------------------------------------------------
-    body_w_mm = float(getattr(spec, "body_w", 8.0))
-    body_h_mm = float(getattr(spec, "body_h", 11.0))
-    lead_len_mm = float(getattr(spec, "lead_len", 16.0))
-    lead_pitch_mm = float(getattr(spec, "lead_pitch", 2.54))
-    hole_d_mm = float(getattr(spec, "hole_d", 3.20))
+    values = resolve_spec_values(spec, _SPEC_DEFAULTS)
+
+    body_w_mm = values["body_w"]
+    body_h_mm = values["body_h"]
+    lead_len_mm = values["lead_len"]
+    lead_pitch_mm = values["lead_pitch"]
+    hole_d_mm = values["hole_d"]
 
     phys_w = body_w_mm + lead_len_mm
     phys_h = body_h_mm
@@ -66,7 +83,9 @@ def draw_to225_package(
     x0 = body_cx - body_w * 0.5
     y0 = body_cy - body_h * 0.5
 
-    canvas.setFillColorRGB(0.12, 0.12, 0.12)  # epoxy black
+    state = canvas_state_t(canvas)
+
+    state.set_fill((0.12, 0.12, 0.12))  # epoxy black
     canvas.rect(x0, y0, body_w, body_h, fill=1, stroke=0)
 
     # --------------------------------------------------------
@@ -76,20 +95,20 @@ def draw_to225_package(
     hole_x = x0 + body_h * 0.5
     hole_y = cy
 
-    canvas.setFillColorRGB(0.25, 0.25, 0.25)
+    state.set_fill((0.25, 0.25, 0.25))
     back_r = hole_r * 1.50
-    for angle in (0, 120, 240):
-        ax = hole_x + back_r * 0.70 * cos(radians(angle))
-        ay = hole_y + back_r * 0.70 * sin(radians(angle))
+    for dx, dy in _BOSS_DIRS:
+        ax = hole_x + back_r * 0.70 * dx
+        ay = hole_y + back_r * 0.70 * dy
         canvas.circle(ax, ay, hole_r * 0.65, fill=1, stroke=0)
 
-    canvas.setFillColorRGB(1, 1, 1)
+    state.set_fill((1, 1, 1))
     canvas.circle(hole_x, hole_y, hole_r, fill=1, stroke=0)
 
     # --------------------------------------------------------
     # Leads
     # --------------------------------------------------------
-    canvas.setFillColorRGB(0.75, 0.75, 0.75)  # silver
+    state.set_fill((0.75, 0.75, 0.75))  # silver
 
     lead_len = draw_w * (lead_len_mm / phys_w)
     lead_th = body_h * 0.12
@@ -107,22 +126,18 @@ def draw_to225_package(
 
     lead_start_x = x0 + body_w
 
+    leads = canvas.beginPath()
     for y in offsets:
-        canvas.rect(
-            lead_start_x,
-            y - lead_th * 0.5,
-            lead_len,
-            lead_th,
-            fill=1,
-            stroke=0,
-        )
+        leads.rect(lead_start_x, y - lead_th * 0.5, lead_len, lead_th)
+
+    canvas.drawPath(leads, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
 
     # --------------------------------------------------------
     # Pin labels
     # --------------------------------------------------------
     fs = rect.height * 0.18
-    canvas.setFont("Helvetica", fs)
-    canvas.setFillColorRGB(0, 0, 0)
+    state.set_font("Helvetica", fs)
+    state.set_fill((0, 0, 0))
 
     label_pad = fs * 0.40
     label_offset = [-label_pad, 0, +label_pad]
@@ -134,8 +149,8 @@ def draw_to225_package(
         canvas.drawString(
             lead_start_x + lead_len + fs * 0.4,
             y + label_offset[i] - fs * 0.4,
-            final_labels[i].upper(),
+            final_labels[i],
         )
 
-    canvas.setFillColor(black)
-    canvas.setStrokeColor(black)
+    state.set_fill((0.0, 0.0, 0.0))
+    state.set_stroke((0.0, 0.0, 0.0))
@@ -1,9 +1,66 @@
 # file: src/packages/to243.py
 
-from reportlab.lib.colors import black
-from reportlab.pdfgen.canvas import Canvas
+from functools import lru_cache
+from typing import Tuple
 
+from reportlab.pdfgen.canvas import FILL_NON_ZERO, Canvas
+
+from src.core.drawing_utils import canvas_state_t
 from src.core.geometry import simple_rect, scale_physical
+from src.packages.tht_helpers import parse_pin_config
+
+
+@lru_cache(maxsize=128)
+def _to243_layout(
+    pin_count: int,
+    body_h: float,
+    bottom_pad_w: float,
+    bottom_pad_h: float,
+    bottom_pitch: float,
+    tab_w: float,
+    tab_h: float,
+    top_pad_w: float,
+    top_pad_h: float,
+    top_pitch: float,
+) -> Tuple[Tuple[float, float, float, float], ...]:
+    """
+    @brief		Pad layout in mm, relative to the body centre.
+
+    		Cached; identical parts share one layout and each draw only
+    		scales and translates it.
+
+    @param pin_count	3, 4 or 6
+    @param body_h	Body height (mm)
+    @param bottom_pad_w	Bottom pad width (mm)
+    @param bottom_pad_h	Bottom pad height (mm)
+    @param bottom_pitch	Bottom pad pitch (mm)
+    @param tab_w	Top tab width (mm)
+    @param tab_h	Top tab height (mm)
+    @param top_pad_w	Top side pad width (mm, 6-pin only)
+    @param top_pad_h	Top side pad height (mm, 6-pin only)
+    @param top_pitch	Top side pad pitch (mm, 6-pin only)
+    @return		(centre x, centre y, w, h) per pad, bottom row first
+    """
+    half_body_h = body_h * 0.5
+
+    if pin_count == 3:
+        bottom_xs: Tuple[float, ...] = (-bottom_pitch, bottom_pitch)
+    else:
+        bottom_xs = (-bottom_pitch, 0.0, bottom_pitch)
+
+    bottom_y = -half_body_h - (bottom_pad_h * 0.5)
+    pads = [(x, bottom_y, bottom_pad_w, bottom_pad_h) for x in bottom_xs]
+
+    tab_y = half_body_h + (tab_h * 0.5)
+    if pin_count == 6:
+        side_y = half_body_h + (top_pad_h * 0.5)
+        pads.append((-top_pitch, side_y, top_pad_w, top_pad_h))
+        pads.append((0.0, tab_y, tab_w, tab_h))
+        pads.append((top_pitch, side_y, top_pad_w, top_pad_h))
+    else:
+        pads.append((0.0, tab_y, tab_w, tab_h))
+
+    return tuple(pads)
 
 
 def draw_to243_package(
@@ -34,9 +91,10 @@ def draw_to243_package(
     final_labels = ["1", "2", "3", "TAB"]
 
     if spec is not None and getattr(spec, "pin_config", None):
-        final_labels = [p.strip() for p in spec.pin_config.replace(",", " ").split()]
+        final_labels = parse_pin_config(spec.pin_config)
     elif default_pin_labels:
         final_labels = list(default_pin_labels)
+    final_labels = [str(label).upper() for label in final_labels]
 
     pin_count = int(info.get("pin_count", 4))
     if pin_count not in [3, 4, 6]:
@@ -75,75 +133,33 @@ def draw_to243_package(
     scale_x = body_w / body_width_mm
     scale_y = body_h / body_height_mm
 
-    bottom_pad_w = bottom_pad_width_mm * scale_x
-    bottom_pad_h = bottom_pad_height_mm * scale_y
-    bottom_pitch = bottom_pitch_mm * scale_x
-
-    top_tab_w = top_tab_width_mm * scale_x
-    top_tab_h = top_tab_height_mm * scale_y
-
-    top_side_pad_w = top_side_pad_width_mm * scale_x
-    top_side_pad_h = top_side_pad_height_mm * scale_y
-    top_pitch = top_pitch_mm * scale_x
-
-    body_x = cx - body_w * 0.5
-    body_y = cy - body_h * 0.5
-
-    bottom_row_y = body_y - bottom_pad_h
-    top_row_y = body_y + body_h
+    layout = _to243_layout(
+        pin_count,
+        body_height_mm,
+        bottom_pad_width_mm,
+        bottom_pad_height_mm,
+        bottom_pitch_mm,
+        top_tab_width_mm,
+        top_tab_height_mm,
+        top_side_pad_width_mm,
+        top_side_pad_height_mm,
+        top_pitch_mm,
+    )
 
-    pad_centres_x = []
-    pad_centres_y = []
-    pad_sizes = []
+    # (centre x, centre y, width, height) per pad, bottom row first.
+    pads = [
+        (cx + rel_x * scale_x, cy + rel_y * scale_y, w * scale_x, h * scale_y)
+        for rel_x, rel_y, w, h in layout
+    ]
 
-    if pin_count == 3:
-        bottom_centres_x = [
-            cx - bottom_pitch,
-            cx + bottom_pitch,
-        ]
-    elif pin_count in [4, 6]:
-        bottom_centres_x = [
-            cx - bottom_pitch,
-            cx,
-            cx + bottom_pitch,
-        ]
-    else:
-        bottom_centres_x = [cx - bottom_pitch, cx + bottom_pitch]
+    state = canvas_state_t(canvas)
 
-    for x in bottom_centres_x:
-        pad_centres_x.append(x)
-        pad_centres_y.append(bottom_row_y + (bottom_pad_h * 0.5))
-        pad_sizes.append((bottom_pad_w, bottom_pad_h))
+    state.set_fill((0.75, 0.75, 0.75))
+    pad_path = canvas.beginPath()
+    for pad_cx, pad_cy, pad_w, pad_h in pads:
+        pad_path.rect(pad_cx - (pad_w * 0.5), pad_cy - (pad_h * 0.5), pad_w, pad_h)
 
-    if pin_count in [3, 4]:
-        pad_centres_x.append(cx)
-        pad_centres_y.append(top_row_y + (top_tab_h * 0.5))
-        pad_sizes.append((top_tab_w, top_tab_h))
-    else:
-        top_centres_x = [
-            cx - top_pitch,
-            cx,
-            cx + top_pitch,
-        ]
-
-        pad_centres_x.append(top_centres_x[0])
-        pad_centres_y.append(top_row_y + (top_side_pad_h * 0.5))
-        pad_sizes.append((top_side_pad_w, top_side_pad_h))
-
-        pad_centres_x.append(top_centres_x[1])
-        pad_centres_y.append(top_row_y + (top_tab_h * 0.5))
-        pad_sizes.append((top_tab_w, top_tab_h))
-
-        pad_centres_x.append(top_centres_x[2])
-        pad_centres_y.append(top_row_y + (top_side_pad_h * 0.5))
-        pad_sizes.append((top_side_pad_w, top_side_pad_h))
-
-    canvas.setFillColorRGB(0.75, 0.75, 0.75)
-    for i in range(0, len(pad_centres_x)):
-        pad_w, pad_h = pad_sizes[i]
-        pad_x = pad_centres_x[i] - (pad_w * 0.5)
-        pad_y = pad_centres_y[i] - (pad_h * 0.5)
-        canvas.rect(pad_x, pad_y, pad_w, pad_h, fill=1, stroke=0)
+    canvas.drawPath(pad_path, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
 
     stroke_width = 1.0
     body_inner_w = max(0.0, body_w - stroke_width)
@@ -153,8 +169,8 @@ def draw_to243_package(
     body_inner_y = cy - (body_inner_h * 0.5)
 
     canvas.setLineWidth(stroke_width)
-    canvas.setFillColorRGB(0.12, 0.12, 0.12)
-    canvas.setStrokeColorRGB(0.2, 0.2, 0.2)
+    state.set_fill((0.12, 0.12, 0.12))
+    state.set_stroke((0.2, 0.2, 0.2))
     canvas.rect(
         body_inner_x,
         body_inner_y,
@@ -167,7 +183,7 @@ def draw_to243_package(
     pin_one_dot_r = min(body_inner_w, body_inner_h) * 0.07
     pin_one_dot_x = body_inner_x + (pin_one_dot_r * 1.8)
     pin_one_dot_y = body_inner_y + body_inner_h - (pin_one_dot_r * 1.8)
-    canvas.setFillColorRGB(0.60, 0.60, 0.60)
+    state.set_fill((0.60, 0.60, 0.60))
     canvas.circle(
         pin_one_dot_x,
         pin_one_dot_y,
@@ -177,39 +193,33 @@ def draw_to243_package(
     )
 
     fs = rect.height * 0.25
-    canvas.setFont("Helvetica", fs)
-    canvas.setFillColorRGB(0.0, 0.0, 0.0)
-
-    labels = []
-    for i in range(0, len(pad_centres_x)):
-        if i < len(final_labels):
-            labels.append(str(final_labels[i]).upper())
-        else:
-            labels.append(str(i + 1))
+    state.set_font("Helvetica", fs)
+    state.set_fill((0.0, 0.0, 0.0))
 
     label_gap = fs * 0.75
     outward_nudge = fs * 0.55
     label_baseline_offset = fs * 0.35
 
-    for i in range(0, len(pad_centres_x)):
-        is_top = pad_centres_y[i] > cy
-        pad_h = pad_sizes[i][1]
-        pad_w = pad_sizes[i][0]
+    for i, (pad_cx, pad_cy, pad_w, pad_h) in enumerate(pads):
+        if i < len(final_labels):
+            label = final_labels[i]
+        else:
+            label = str(i + 1)
 
         delta_x = 0.0
-        if pad_centres_x[i] < cx:
+        if pad_cx < cx:
             delta_x = -min(outward_nudge, pad_w * 0.9)
-        elif pad_centres_x[i] > cx:
+        elif pad_cx > cx:
             delta_x = min(outward_nudge, pad_w * 0.9)
 
-        if is_top:
-            label_y = pad_centres_y[i] + (pad_h * 0.5) + label_gap
+        if pad_cy > cy:
+            label_y = pad_cy + (pad_h * 0.5) + label_gap
         else:
-            label_y = pad_centres_y[i] - (pad_h * 0.5) - label_gap
+            label_y = pad_cy - (pad_h * 0.5) - label_gap
 
         label_y = label_y - label_baseline_offset
 
-        canvas.drawCentredString(pad_centres_x[i] + delta_x, label_y, labels[i])
+        canvas.drawCentredString(pad_cx + delta_x, label_y, label)
 
-    canvas.setFillColor(black)
-    canvas.setStrokeColor(black)
+    state.set_fill((0.0, 0.0, 0.0))
+    state.set_stroke((0.0, 0.0, 0.0))
@@ -1,16 +1,34 @@
 # file: src/packages/to247.py
 
-from reportlab.lib.colors import black
-from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfgen.canvas import FILL_NON_ZERO, Canvas
 
+from src.core.drawing_utils import canvas_state_t
 from src.core.geometry import simple_rect, scale_physical
 from src.packages.tht_helpers import (
     parse_pin_config,
     default_numeric_labels,
+    compute_label_font_size,
     compute_offsets,
+    label_adjust_signs,
+    resolve_spec_values,
 )
 
 
+# Spec names read per draw, with their defaults.
+_SPEC_DEFAULTS = {
+    "body_w": 20.1,
+    "body_h": 15.9,
+    "lead_len": 20.0,
+    "hole_d_mm": 3.6,
+    "scallop_w_mm": 4.0,
+    "scallop_h_mm": 2.0,
+    "scallop_x_mm": 6.2,
+    "lead_pitch_3_mm": 5.44,
+    "lead_pitch_group_mm": 2.54,
+    "group_gap_mm": 5.08,
+}
+
+
 def draw_to247_package(
     canvas: Canvas,
     rect: simple_rect,
@@ -27,19 +45,22 @@ def draw_to247_package(
         final_labels = getattr(spec, "pin_labels")
     else:
         final_labels = default_numeric_labels(pin_count)
+    final_labels = [str(label).upper() for label in final_labels]
+
+    values = resolve_spec_values(spec, _SPEC_DEFAULTS)
 
-    body_w_mm = float(getattr(spec, "body_w", 20.1))
-    body_h_mm = float(getattr(spec, "body_h", 15.9))
-    lead_len_mm = float(getattr(spec, "lead_len", 20.0))
+    body_w_mm = values["body_w"]
+    body_h_mm = values["body_h"]
+    lead_len_mm = values["lead_len"]
 
-    hole_d_mm = float(getattr(spec, "hole_d_mm", 3.6))
-    scallop_w_mm = float(getattr(spec, "scallop_w_mm", 4.0))
-    scallop_h_mm = float(getattr(spec, "scallop_h_mm", 2.0))
-    scallop_x_mm = float(getattr(spec, "scallop_x_mm", 6.2))
+    hole_d_mm = values["hole_d_mm"]
+    scallop_w_mm = values["scallop_w_mm"]
+    scallop_h_mm = values["scallop_h_mm"]
+    scallop_x_mm = values["scallop_x_mm"]
 
-    pitch_3lead_mm = float(getattr(spec, "lead_pitch_3_mm", 5.44))
-    pitch_group_mm = float(getattr(spec, "lead_pitch_group_mm", 2.54))
-    group_gap_mm = float(getattr(spec, "group_gap_mm", 5.08))
+    pitch_3lead_mm = values["lead_pitch_3_mm"]
+    pitch_group_mm = values["lead_pitch_group_mm"]
+    group_gap_mm = values["group_gap_mm"]
 
     phys_w = body_w_mm + lead_len_mm
     phys_h = body_h_mm
@@ -61,7 +82,9 @@ def draw_to247_package(
     body_h = draw_h
     lead_x = body_x + body_w
 
-    canvas.setFillColorRGB(0.12, 0.12, 0.12)
+    state = canvas_state_t(canvas)
+
+    state.set_fill((0.12, 0.12, 0.12))
     canvas.rect(body_x, body_y, body_w, body_h, fill=1, stroke=0)
 
     hole_r = (hole_d_mm / body_h_mm) * draw_h * 0.5
@@ -72,7 +95,7 @@ def draw_to247_package(
     top_edge_y = body_y + body_h - scallop_h
     bot_edge_y = body_y
 
-    canvas.setFillColorRGB(1.0, 1.0, 1.0)
+    state.set_fill((1.0, 1.0, 1.0))
     canvas.circle(
         body_x + scallop_dx,
         cy,
@@ -81,18 +104,19 @@ def draw_to247_package(
         stroke=0,
     )
 
-    canvas.setFillColorRGB(0.25, 0.25, 0.25)
+    state.set_fill((0.25, 0.25, 0.25))
+    scallops = canvas.beginPath()
     for edge_y in (top_edge_y, bot_edge_y):
-        canvas.rect(
+        scallops.rect(
             body_x + scallop_dx - scallop_w * 0.5,
             edge_y,
             scallop_w,
             scallop_h,
-            fill=1,
-            stroke=0,
         )
 
-    canvas.setFillColorRGB(0.75, 0.75, 0.75)
+    canvas.drawPath(scallops, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
+
+    state.set_fill((0.75, 0.75, 0.75))
 
     lead_th = body_h * 0.07
 
@@ -134,43 +158,27 @@ def draw_to247_package(
 
         offsets = [pin1_off, pin2_off, pin3_off, pin4_off]
 
+    half_lead_th = lead_th * 0.5
+    half_step_th = lead_step_th * 0.5
+    tail_x = lead_x + lead_step_len
+    tail_len = max(0.0, lead_len - lead_step_len)
+
+    leads = canvas.beginPath()
     for off in offsets:
-        regular_y = cy + off - lead_th * 0.5
-        step_y = cy + off - lead_step_th * 0.5
-
-        canvas.rect(
-            lead_x,
-            step_y,
-            lead_step_len,
-            lead_step_th,
-            fill=1,
-            stroke=0,
-        )
+        pin_y = cy + off
+        regular_y = pin_y - half_lead_th
+        step_y = pin_y - half_step_th
 
-        remaining_len = lead_len - lead_step_len
-        if remaining_len < 0.0:
-            remaining_len = 0.0
-
-        canvas.rect(
-            lead_x + lead_step_len,
-            regular_y,
-            remaining_len,
-            lead_th,
-            fill=1,
-            stroke=0,
-        )
+        leads.rect(lead_x, step_y, lead_step_len, lead_step_th)
 
-    if pin_count <= 4:
-        fs = rect.height * 0.20
-    else:
-        fs = rect.height * (0.20 - 0.03 * (pin_count - 4))
+        leads.rect(tail_x, regular_y, tail_len, lead_th)
+
+    canvas.drawPath(leads, fill=1, stroke=0, fillMode=FILL_NON_ZERO)
 
-    min_font_fraction = 0.10
-    if fs < rect.height * min_font_fraction:
-        fs = rect.height * min_font_fraction
+    fs = compute_label_font_size(rect.height, pin_count)
 
-    canvas.setFont("Helvetica", fs)
-    canvas.setFillColorRGB(0.0, 0.0, 0.0)
+    state.set_font("Helvetica", fs)
+    state.set_fill((0.0, 0.0, 0.0))
 
     label_pad = fs * 0.35
 
@@ -180,23 +188,15 @@ def draw_to247_package(
     if pin_count == 4:
         label_y_adjust = [-label_pad, -label_pad, 0.0, +label_pad]
     else:
-        label_mid = (len(offsets) - 1) / 2.0
-        label_y_adjust: list[float] = []
-        for j in range(len(offsets)):
-            rel = j - label_mid
-            if rel < 0.0:
-                adj = -label_pad
-            elif rel > 0.0:
-                adj = +label_pad
-            else:
-                adj = 0.0
-            label_y_adjust.append(adj)
+        label_y_adjust = [
+            sign * label_pad for sign in label_adjust_signs(len(offsets))
+        ]
 
     for i, off in enumerate(offsets):
         if i >= len(final_labels):
             break
 
-        label = str(final_labels[i]).upper()
+        label = final_labels[i]
         py = cy + off + label_y_adjust[i]
 
         canvas.drawString(
@@ -205,5 +205,5 @@ def draw_to247_package(
             label,
         )
 
-    canvas.setFillColor(black)
-    canvas.setStrokeColor(black)
+    state.set_fill((0.0, 0.0, 0.0))
+    state.set_stroke((0.0, 0.0, 0.0))
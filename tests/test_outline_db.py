@@ -0,0 +1,38 @@
+# file: tests/test_outline_db.py
+
+"""
+@brief	Regression checks for the loose package key fallback.
+"""
+
+import unittest
+
+from src.packages.resolve import resolve_package
+
+
+class loose_lookup_test_t(unittest.TestCase):
+    def test_distinct_packages_do_not_resolve(self) -> None:
+        # Long-body packages and split digit runs must not fall back to a
+        # different package.
+        for raw in ("TO-92L", "SOT-23L", "TO-9-5", "TO-2-20", "DO-2-14-AC"):
+            with self.subTest(raw=raw):
+                self.assertIsNone(resolve_package(raw))
+
+    def test_lead_suffix_and_optional_dashes_resolve(self) -> None:
+        cases = (
+            ("TO-220-5L", "TO-220-AB-5L"),
+            ("TO220-5", "TO-220-AB-5L"),
+            ("TO220-5L", "TO-220-AB-5L"),
+            ("TO-220F", "TO-220-F"),
+            ("TO220", "TO-220-AB"),
+            ("SOT23-5L", "SOT-23-5"),
+            ("SOT89-2", "TO-243-AB"),
+        )
+        for raw, print_id in cases:
+            with self.subTest(raw=raw):
+                resolved = resolve_package(raw)
+                self.assertIsNotNone(resolved)
+                self.assertEqual(resolved.print_id, print_id)
+
+
+if __name__ == "__main__":
+    unittest.main()